@@ -1,46 +1,192 @@
-from importlib import import_module
+import argparse
+import os
 import sys
 import time
 
-from solutions.common.input_reader import get_input_lines
+from solutions.benchmark import (
+    benchmark_day,
+    compare_implementations,
+    print_benchmark_report,
+    print_comparison_report,
+)
+from solutions.common.input_reader import INPUTS_DIRECTORY_VARIABLE
+from solutions.history import (
+    DEFAULT_HISTORY_PATH,
+    append_history,
+    current_commit,
+    find_regressions,
+    make_records,
+    print_comparison,
+    read_history,
+    select_baseline,
+)
+from solutions.limits import BYTES_PER_MIB, Limits, run_limited_days
+from solutions.profiling import print_profile_report, profile_day
+from solutions.runner import (
+    parse_days,
+    print_batch_report,
+    print_day_report,
+    run_day,
+    run_days,
+)
 
 
-day_num = sys.argv[1]
-if len(sys.argv) > 2:
-    implementation = sys.argv[2]
-else:
-    implementation = "alpha"
-
-HLINE_SIZE = 60
-
-print("="*HLINE_SIZE)
-print(f"Running solutions to day {day_num}")
-print("-"*HLINE_SIZE)
-
-solution_module = import_module(f"solutions.day{day_num.zfill(2)}.{implementation}")
-input_lines = get_input_lines(int(day_num))
-digester = getattr(solution_module, "digest_input", lambda x: x)
-digested_lines = digester(input_lines)
-
-part_one = getattr(solution_module, "part_one", lambda x: "(solution pending)")
-start_one = time.time()
-digested_lines = digester(input_lines[:])
-digest_one = time.time()
-solution_one = part_one(digested_lines)
-end_one = time.time()
-print(f"Part one solution: {solution_one}")
+parser = argparse.ArgumentParser(prog="python -m solutions")
+parser.add_argument(
+    "day", help='a day number, a range such as "3-7", a list such as "1,4", or "all"'
+)
+parser.add_argument("implementation", nargs="?", default="alpha")
+parser.add_argument(
+    "--workers",
+    type=int,
+    default=None,
+    help="worker processes for multi-day runs (defaults to the CPU count)",
+)
+parser.add_argument(
+    "--parallel-parts",
+    action="store_true",
+    help="run part one and part two in separate worker processes",
+)
+parser.add_argument(
+    "--timeout",
+    type=float,
+    metavar="SECONDS",
+    help="kill a part that runs longer than this and report it as TIMEOUT",
+)
+parser.add_argument(
+    "--max-memory",
+    type=int,
+    metavar="MIB",
+    help="cap each part's address space and report it as OOM when exceeded",
+)
+parser.add_argument(
+    "--bench",
+    type=int,
+    metavar="N",
+    help="time digest and solve N times per part and report statistics",
+)
+parser.add_argument(
+    "--warmup",
+    type=int,
+    default=1,
+    help="untimed runs per part before benchmarking (default 1)",
+)
+parser.add_argument(
+    "--versus",
+    action="store_true",
+    help="benchmark every implementation of each day and check their answers agree",
+)
+parser.add_argument(
+    "--profile",
+    action="store_true",
+    help="run each part under cProfile, print hotspots and save a .prof file",
+)
+parser.add_argument(
+    "--memprofile",
+    action="store_true",
+    help="run each part under tracemalloc and print the top allocation sites",
+)
+parser.add_argument(
+    "--profile-dir", default=".", help="directory for .prof files (default .)"
+)
+parser.add_argument(
+    "--record",
+    action="store_true",
+    help="append benchmark medians to the history file, keyed by git commit",
+)
+parser.add_argument(
+    "--compare",
+    action="store_true",
+    help="compare benchmark medians against the history and fail on regressions",
+)
+parser.add_argument(
+    "--baseline",
+    metavar="COMMIT",
+    help="commit to compare against (defaults to the latest other recorded commit)",
+)
+parser.add_argument(
+    "--threshold",
+    type=float,
+    default=0.1,
+    help="fractional slowdown that counts as a regression (default 0.1)",
+)
+parser.add_argument("--history", default=DEFAULT_HISTORY_PATH, help="history file")
+parser.add_argument(
+    "--inputs",
+    metavar="DIRECTORY",
+    help="read XX.txt input files from here instead of inputs/",
+)
+args = parser.parse_args()
+limited = args.timeout is not None or args.max_memory is not None
+measuring = args.bench or args.versus or args.profile or args.memprofile
+if limited and (measuring or args.record or args.compare):
+    parser.error(
+        "--timeout and --max-memory can't be combined with --bench, --versus, "
+        "--profile, --memprofile, --record or --compare"
+    )
+if args.parallel_parts and (measuring or args.record or args.compare):
+    parser.error(
+        "--parallel-parts can't be combined with --bench, --versus, --profile, "
+        "--memprofile, --record or --compare"
+    )
+if args.inputs is not None:
+    os.environ[INPUTS_DIRECTORY_VARIABLE] = args.inputs
+if (args.record or args.compare) and not args.bench:
+    args.bench = 10
 
-part_two = getattr(solution_module, "part_two", lambda x: "(solution pending)")
-start_two = time.time()
-digested_lines = digester(input_lines)
-digest_two = time.time()
-solution_two = part_two(digested_lines)
-end_two = time.time()
-print(f"Part two solution: {solution_two}")
-
-print("-"*HLINE_SIZE)
-
-print(f"Part one runtime: {end_one - start_one:.6f} ({digest_one - start_one:.6f} digesting)")
-print(f"Part two runtime: {end_two - start_two:.6f} ({digest_two - start_two:.6f} digesting)")
-
-print("="*HLINE_SIZE)
+days = parse_days(args.day)
+if args.profile or args.memprofile:
+    for day in days:
+        reports = profile_day(
+            day, args.implementation, args.profile, args.memprofile, args.profile_dir
+        )
+        print_profile_report(day, args.implementation, reports)
+elif args.versus:
+    repeats = args.bench or 5
+    mismatched = False
+    for day in days:
+        comparisons = compare_implementations(day, repeats, args.warmup)
+        print_comparison_report(day, comparisons, repeats)
+        mismatched |= not all(c.answers_agree for c in comparisons)
+    if mismatched:
+        sys.exit(1)
+elif args.bench:
+    commit, dirty = current_commit()
+    records = []
+    # Benchmarks run one day at a time so that days don't compete for cores.
+    for day in days:
+        benchmarks = benchmark_day(day, args.implementation, args.bench, args.warmup)
+        print_benchmark_report(day, args.implementation, benchmarks, args.bench)
+        records.extend(
+            make_records(
+                day, args.implementation, benchmarks, args.bench, commit, dirty
+            )
+        )
+    if args.compare:
+        baseline = select_baseline(read_history(args.history), commit, args.baseline)
+        regressions = find_regressions(records, baseline, args.threshold)
+        print_comparison(records, baseline, regressions)
+    if args.record:
+        append_history(records, args.history)
+    if args.compare and regressions:
+        sys.exit(1)
+elif limited:
+    max_memory = args.max_memory and args.max_memory * BYTES_PER_MIB
+    limits = Limits(args.timeout, max_memory)
+    batch_start = time.perf_counter()
+    results = run_limited_days(
+        days, args.implementation, limits, args.workers, args.parallel_parts
+    )
+    if len(days) == 1:
+        print_day_report(results[0])
+    else:
+        print_batch_report(results, time.perf_counter() - batch_start)
+elif len(days) == 1 and args.parallel_parts:
+    results = run_days(days, args.implementation, 2, parallel_parts=True)
+    print_day_report(results[0])
+elif len(days) == 1:
+    print_day_report(run_day(days[0], args.implementation, capture_errors=False))
+else:
+    batch_start = time.perf_counter()
+    results = run_days(days, args.implementation, args.workers, args.parallel_parts)
+    print_batch_report(results, time.perf_counter() - batch_start)
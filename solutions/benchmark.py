@@ -0,0 +1,249 @@
+from dataclasses import dataclass
+import math
+import statistics
+import time
+from types import ModuleType
+from typing import Any
+
+import pytest
+
+from solutions.common.input_reader import get_input_lines
+from solutions.runner import (
+    HLINE_SIZE,
+    PART_NAMES,
+    available_implementations,
+    format_solution,
+    load_module,
+)
+
+
+NANOSECONDS_PER_MILLISECOND = 1_000_000
+
+
+@dataclass
+class TimingStats:
+    """All values are in nanoseconds."""
+
+    minimum: int
+    median: float
+    p95: int
+    stddev: float
+
+    @classmethod
+    def from_samples(cls, samples: list[int]) -> "TimingStats":
+        ordered = sorted(samples)
+        p95_rank = math.ceil(0.95 * len(ordered)) - 1
+        return cls(
+            ordered[0],
+            statistics.median(ordered),
+            ordered[p95_rank],
+            statistics.stdev(ordered) if len(ordered) > 1 else 0.0,
+        )
+
+
+@dataclass
+class PartBenchmark:
+    part_name: str
+    solution: Any
+    digest: TimingStats
+    solve: TimingStats
+    total: TimingStats
+
+
+def benchmark_part(
+    solution_module: ModuleType,
+    part_name: str,
+    input_lines: list[str],
+    repeats: int,
+    warmup: int = 1,
+) -> PartBenchmark:
+    """
+    Times `digest_input` and the part separately, `repeats` times after `warmup`
+    untimed runs. Each run digests its own copy of the input, since several solvers
+    consume what they are given.
+    """
+    digester = getattr(solution_module, "digest_input", lambda x: x)
+    solver = getattr(solution_module, part_name, lambda x: "(solution pending)")
+    digest_samples: list[int] = []
+    solve_samples: list[int] = []
+    total_samples: list[int] = []
+    solution = None
+    for iteration in range(warmup + repeats):
+        start = time.perf_counter_ns()
+        digested_lines = digester(input_lines[:])
+        digest_end = time.perf_counter_ns()
+        solution = solver(digested_lines)
+        end = time.perf_counter_ns()
+        if iteration >= warmup:
+            digest_samples.append(digest_end - start)
+            solve_samples.append(end - digest_end)
+            total_samples.append(end - start)
+    return PartBenchmark(
+        part_name,
+        solution,
+        TimingStats.from_samples(digest_samples),
+        TimingStats.from_samples(solve_samples),
+        TimingStats.from_samples(total_samples),
+    )
+
+
+def benchmark_day(
+    day: int, implementation: str, repeats: int, warmup: int = 1
+) -> list[PartBenchmark]:
+    solution_module = load_module(day, implementation)
+    input_lines = get_input_lines(day)
+    return [
+        benchmark_part(solution_module, part_name, input_lines, repeats, warmup)
+        for part_name in PART_NAMES
+    ]
+
+
+@dataclass
+class ImplementationComparison:
+    part_name: str
+    benchmarks: dict[str, PartBenchmark]
+
+    @property
+    def answers_agree(self) -> bool:
+        solutions = [benchmark.solution for benchmark in self.benchmarks.values()]
+        return all(solution == solutions[0] for solution in solutions[1:])
+
+    def speedups(self) -> dict[str, float]:
+        """Median total runtime of the first implementation over each one's."""
+        if not self.benchmarks:
+            return {}
+        reference = next(iter(self.benchmarks.values())).total.median
+        return {
+            name: reference / benchmark.total.median if benchmark.total.median else 0
+            for name, benchmark in self.benchmarks.items()
+        }
+
+
+def compare_implementations(
+    day: int, repeats: int, warmup: int = 1
+) -> list[ImplementationComparison]:
+    """
+    Benchmarks every implementation of a day against the same input. A module is
+    only included for the parts it defines, since some only solve one part.
+    """
+    input_lines = get_input_lines(day)
+    solution_modules = {
+        name: load_module(day, name) for name in available_implementations(day)
+    }
+    return [
+        ImplementationComparison(
+            part_name,
+            {
+                name: benchmark_part(
+                    solution_module, part_name, input_lines, repeats, warmup
+                )
+                for name, solution_module in solution_modules.items()
+                if hasattr(solution_module, part_name)
+            },
+        )
+        for part_name in PART_NAMES
+    ]
+
+
+def format_milliseconds(nanoseconds: float) -> str:
+    return f"{nanoseconds / NANOSECONDS_PER_MILLISECOND:.3f}"
+
+
+def print_benchmark_report(
+    day: int, implementation: str, benchmarks: list[PartBenchmark], repeats: int
+) -> None:
+    print("=" * HLINE_SIZE)
+    print(f"Benchmarking day {day} ({implementation}), {repeats} repeats, in ms")
+    print("-" * HLINE_SIZE)
+    for benchmark in benchmarks:
+        print(f"{benchmark.part_name}: {format_solution(benchmark.solution)}")
+    print("-" * HLINE_SIZE)
+    print(
+        f"{'Part':<10}{'Phase':<8}{'min':>10}{'median':>10}{'p95':>10}{'stddev':>10}"
+    )
+    for benchmark in benchmarks:
+        for phase, stats in (
+            ("digest", benchmark.digest),
+            ("solve", benchmark.solve),
+            ("total", benchmark.total),
+        ):
+            print(
+                f"{benchmark.part_name:<10}{phase:<8}"
+                f"{format_milliseconds(stats.minimum):>10}"
+                f"{format_milliseconds(stats.median):>10}"
+                f"{format_milliseconds(stats.p95):>10}"
+                f"{format_milliseconds(stats.stddev):>10}"
+            )
+    print("=" * HLINE_SIZE)
+
+
+def print_comparison_report(
+    day: int, comparisons: list[ImplementationComparison], repeats: int
+) -> None:
+    print("=" * HLINE_SIZE)
+    print(f"Comparing implementations of day {day}, {repeats} repeats, in ms")
+    for comparison in comparisons:
+        print("-" * HLINE_SIZE)
+        if not comparison.benchmarks:
+            print(f"{comparison.part_name}: no implementations")
+            continue
+        speedups = comparison.speedups()
+        print(f"{'Part':<10}{'Impl':<10}{'median':>10}{'min':>10}{'speedup':>10}")
+        for name, benchmark in comparison.benchmarks.items():
+            print(
+                f"{comparison.part_name:<10}{name:<10}"
+                f"{format_milliseconds(benchmark.total.median):>10}"
+                f"{format_milliseconds(benchmark.total.minimum):>10}"
+                f"{speedups[name]:>9.2f}x"
+            )
+        if comparison.answers_agree:
+            solution = next(iter(comparison.benchmarks.values())).solution
+            print(f"All answers agree: {format_solution(solution)}")
+        else:
+            for name, benchmark in comparison.benchmarks.items():
+                print(f"MISMATCH {name}: {format_solution(benchmark.solution)}")
+    print("=" * HLINE_SIZE)
+
+
+def make_benchmark(solution: Any, total_median: int) -> PartBenchmark:
+    stats = TimingStats(total_median, total_median, total_median, 0.0)
+    return PartBenchmark("part_one", solution, stats, stats, stats)
+
+
+def test_implementation_comparison():
+    comparison = ImplementationComparison(
+        "part_one",
+        {"alpha": make_benchmark(5, 300), "beta": make_benchmark(5, 100)},
+    )
+    assert comparison.answers_agree
+    assert comparison.speedups() == {"alpha": 1.0, "beta": 3.0}
+
+
+def test_implementation_comparison_mismatch():
+    comparison = ImplementationComparison(
+        "part_one",
+        {"alpha": make_benchmark(5, 300), "beta": make_benchmark(6, 100)},
+    )
+    assert not comparison.answers_agree
+
+
+def test_timing_stats():
+    stats = TimingStats.from_samples(list(range(100, 0, -1)))
+    assert stats.minimum == 1
+    assert stats.median == 50.5
+    assert stats.p95 == 95
+    assert stats.stddev == pytest.approx(29.011, abs=0.001)
+
+
+def test_timing_stats_single_sample():
+    stats = TimingStats.from_samples([7])
+    assert (stats.minimum, stats.median, stats.p95, stats.stddev) == (7, 7, 7, 0.0)
+
+
+def test_benchmark_part_uses_fresh_input():
+    consuming = ModuleType("consuming")
+    consuming.part_one = lambda lines: len([lines.pop() for _ in range(len(lines))])
+    input_lines = ["a", "b", "c"]
+    benchmark = benchmark_part(consuming, "part_one", input_lines, repeats=3)
+    assert benchmark.solution == 3
+    assert input_lines == ["a", "b", "c"]
@@ -0,0 +1,248 @@
+from functools import lru_cache
+from typing import Optional, Sequence
+
+
+EMPTY = "."
+# The rows the second part unfolds between the two rows of the four rooms
+FOLDED_ROWS = ["DCBA", "DBAC"]
+
+
+def flavor(room_number: int) -> str:
+    return chr(ord("A") + room_number)
+
+
+class Layout:
+    """
+    Move tables and packed states for one shape of burrow, built once.
+
+    A state is one int with `cell_bits` per cell, along the hallway and then down
+    each room in turn from the top, holding 0 for an empty cell or the number of
+    the pod's room plus one. Every route has an obstruction mask of the hallway
+    cells it crosses, so a route is clear when the state ANDed with it is zero.
+
+    Pods move out of a room at most once, and only if the room holds a pod of
+    another flavor, and into a room only once, their own, when it holds no pod
+    of another flavor. `legal_moves` lists every such move, and `moves` prunes
+    them for the search, which cuts most of the branching on deep burrows.
+    """
+
+    def __init__(self, hall_size: int, exits: tuple[int, ...], depth: int):
+        self.hall_size = hall_size
+        self.exits = exits
+        self.depth = depth
+        self.costs = [0] + [10**number for number in range(len(exits))]
+        bits = self.cell_bits = len(exits).bit_length()
+        self.cell_mask = (1 << bits) - 1
+        self.hall_shifts = [bits * cell for cell in range(hall_size)]
+        self.room_shifts = [
+            bits * (hall_size + number * depth) for number in range(len(exits))
+        ]
+        self.room_mask = (1 << bits * depth) - 1
+
+        def obstruction(first: int, last: int) -> int:
+            cells = range(min(first, last), max(first, last) + 1)
+            return sum(self.cell_mask << self.hall_shifts[cell] for cell in cells)
+
+        # From a room's exit to a hallway cell, both included
+        self.exit_routes = [
+            [obstruction(exit, cell) for cell in range(hall_size)] for exit in exits
+        ]
+        # From a hallway cell, not included, to a room's exit
+        self.entry_routes = [
+            [
+                obstruction(exit, cell) & ~obstruction(cell, cell)
+                for exit in exits
+            ]
+            for cell in range(hall_size)
+        ]
+        # The cells from `start` up to `end` that a pod may stop at, which are all
+        # but those right outside a room
+        self.stops = [
+            [
+                [cell for cell in range(start, end) if cell not in exits]
+                for end in range(hall_size + 1)
+            ]
+            for start in range(hall_size + 1)
+        ]
+        # Walking from a hallway cell to the exit of a code's room
+        self.hall_estimates = [
+            [0]
+            + [
+                cost * abs(cell - exit)
+                for cost, exit in zip(self.costs[1:], exits)
+            ]
+            for cell in range(hall_size)
+        ]
+        self._rooms: list[dict[int, tuple[bool, int, int, int]]] = [
+            {} for _ in exits
+        ]
+
+    @classmethod
+    @lru_cache(maxsize=None)
+    def for_burrow(
+        cls, hall_size: int, exits: tuple[int, ...], depth: int
+    ) -> "Layout":
+        return cls(hall_size, exits, depth)
+
+    def pack(self, hallway: str, rooms: Sequence[str]) -> int:
+        codes = {flavor(number): number + 1 for number in range(len(self.exits))}
+        codes[EMPTY] = 0
+        state = 0
+        for cell, pod in enumerate(hallway + "".join(rooms)):
+            state |= codes[pod] << self.cell_bits * cell
+        return state
+
+    def room(self, number: int, contents: int) -> tuple[bool, int, int, int]:
+        """
+        Classifies a room's packed contents as whether it is open to its own
+        flavor (holding no other), how many pods it holds, the code of its top
+        pod, and the least cost of finishing it from its exit: moving every pod
+        that has to leave out to the exit of its own room, and filling it. Pods
+        settled at the bottom of their own room stay; one above them has to step
+        aside and back. Filling takes one step into the first free slot for each
+        pod still to come, two for the next, and so on.
+        """
+        room = self._rooms[number].get(contents)
+        if room is not None:
+            return room
+        code = number + 1
+        bits = self.cell_bits
+        codes = [contents >> bits * slot & self.cell_mask for slot in range(self.depth)]
+        filled = self.depth - codes.count(0)
+        settled = 0
+        while settled < self.depth and codes[-1 - settled] == code:
+            settled += 1
+        missing = self.depth - settled
+        estimate = self.costs[code] * missing * (missing + 1) // 2
+        for slot, other in enumerate(codes[:missing]):
+            if other:
+                walk = abs(self.exits[other - 1] - self.exits[number]) or 2
+                estimate += self.costs[other] * (slot + 1 + walk)
+        room = (
+            settled == filled,
+            filled,
+            codes[self.depth - filled] if filled else 0,
+            estimate,
+        )
+        self._rooms[number][contents] = room
+        return room
+
+    def heuristic(self, state: int) -> int:
+        """A consistent lower bound on the cost left to solve the state"""
+        mask = self.cell_mask
+        total = sum(
+            estimates[state >> shift & mask]
+            for estimates, shift in zip(self.hall_estimates, self.hall_shifts)
+        )
+        for number, shift in enumerate(self.room_shifts):
+            total += self.room(number, state >> shift & self.room_mask)[3]
+        return total
+
+    def _rooms_of(self, state: int) -> list[tuple[bool, int, int, int]]:
+        return [
+            self.room(number, state >> shift & self.room_mask)
+            for number, shift in enumerate(self.room_shifts)
+        ]
+
+    def _entry(
+        self, rooms: list[tuple[bool, int, int, int]], target: int
+    ) -> tuple[int, int]:
+        """The packed pod in the target room's free top slot, and its depth"""
+        slot = self.depth - 1 - rooms[target][1]
+        shift = self.room_shifts[target] + self.cell_bits * slot
+        return (target + 1) << shift, slot + 1
+
+    def moves(self, state: int) -> list[tuple[int, int]]:
+        """
+        The moves the search tries: a move home alone when there is one, as it
+        has to be made at some point and costs the same whenever it is made, and
+        otherwise every legal move.
+        """
+        rooms = self._rooms_of(state)
+        home = self._home_move(state, rooms)
+        return [home] if home is not None else self._legal_moves(state, rooms)
+
+    def legal_moves(self, state: int) -> list[tuple[int, int]]:
+        """
+        The packed states one legal move away, with the cost of the move: pods
+        leaving rooms, in room order, to the hallway cells they can reach on the
+        left and then on the right, or to their own room instead when it is open
+        and reachable on that side; then pods in the hallway, in cell order, that
+        can go home.
+        """
+        return self._legal_moves(state, self._rooms_of(state))
+
+    def _home_move(
+        self, state: int, rooms: list[tuple[bool, int, int, int]]
+    ) -> Optional[tuple[int, int]]:
+        bits = self.cell_bits
+        mask = self.cell_mask
+        exits = self.exits
+        for cell, shift in enumerate(self.hall_shifts):
+            code = state >> shift & mask
+            if not code:
+                continue
+            target = code - 1
+            if rooms[target][0] and not state & self.entry_routes[cell][target]:
+                pod, steps = self._entry(rooms, target)
+                steps += abs(cell - exits[target])
+                return state & ~(mask << shift) | pod, self.costs[code] * steps
+        for number, (is_open, filled, code, _) in enumerate(rooms):
+            if is_open:
+                continue
+            target = code - 1
+            exit = exits[number]
+            if rooms[target][0] and not state & self.exit_routes[number][exits[target]]:
+                slot = self.depth - filled
+                lifted = state & ~(mask << self.room_shifts[number] + bits * slot)
+                pod, steps = self._entry(rooms, target)
+                steps += slot + 1 + abs(exit - exits[target])
+                return lifted | pod, self.costs[code] * steps
+        return None
+
+    def _legal_moves(
+        self, state: int, rooms: list[tuple[bool, int, int, int]]
+    ) -> list[tuple[int, int]]:
+        bits = self.cell_bits
+        mask = self.cell_mask
+        exits = self.exits
+        moves = []
+        for number, (is_open, filled, code, _) in enumerate(rooms):
+            if is_open:
+                continue
+            slot = self.depth - filled
+            lifted = state & ~(mask << self.room_shifts[number] + bits * slot)
+            cost = self.costs[code]
+            exit = exits[number]
+            routes = self.exit_routes[number]
+            target = code - 1
+            target_exit = exits[target]
+            pod, steps = self._entry(rooms, target)
+            home = (lifted | pod, cost * (steps + slot + 1 + abs(exit - target_exit)))
+            left = exit - 1
+            while left >= 0 and not state & routes[left]:
+                left -= 1
+            right = exit + 1
+            while right < self.hall_size and not state & routes[right]:
+                right += 1
+            for first, last in ((left + 1, exit), (exit + 1, right)):
+                if rooms[target][0] and first <= target_exit < last:
+                    moves.append(home)
+                    continue
+                for cell in self.stops[first][last]:
+                    moves.append(
+                        (
+                            lifted | code << self.hall_shifts[cell],
+                            cost * (slot + 1 + abs(cell - exit)),
+                        )
+                    )
+        for cell, shift in enumerate(self.hall_shifts):
+            code = state >> shift & mask
+            if not code:
+                continue
+            target = code - 1
+            if rooms[target][0] and not state & self.entry_routes[cell][target]:
+                pod, steps = self._entry(rooms, target)
+                steps += abs(cell - exits[target])
+                moves.append((state & ~(mask << shift) | pod, self.costs[code] * steps))
+        return moves
@@ -0,0 +1,190 @@
+from typing import Iterable, Iterator
+
+import pytest
+
+
+DIGITS = bytes.maketrans(b"0123456789", bytes(range(10)))
+
+
+class Grid:
+    """
+    Dense grid of byte values (0-255), stored row-major in one flat `bytearray`.
+
+    The grid is surrounded by `padding` rings of `border` cells. With a padding of
+    at least one, every neighbor of a cell inside the grid is a valid flat index,
+    so neighbors are found by adding `offsets4` or `offsets8` with no bounds
+    checks; the border value acts as a wall. Cells are usually addressed by flat
+    index, and `index` and `coordinates` convert to and from (x, y).
+    """
+
+    __slots__ = (
+        "width",
+        "height",
+        "padding",
+        "border",
+        "stride",
+        "cells",
+        "offsets4",
+        "offsets8",
+    )
+
+    def __init__(
+        self, width: int, height: int, fill: int = 0, padding: int = 0, border: int = 0
+    ):
+        self.width = width
+        self.height = height
+        self.padding = padding
+        self.border = border
+        self.stride = width + 2 * padding
+        self.cells = bytearray([border]) * (self.stride * (height + 2 * padding))
+        if fill != border:
+            row = bytes([fill]) * width
+            for y in range(height):
+                self.set_row(y, row)
+        stride = self.stride
+        self.offsets4 = (-stride, -1, 1, stride)
+        self.offsets8 = (
+            -stride - 1,
+            -stride,
+            -stride + 1,
+            -1,
+            1,
+            stride - 1,
+            stride,
+            stride + 1,
+        )
+
+    @classmethod
+    def from_rows(
+        cls, rows: Iterable[Iterable[int]], padding: int = 0, border: int = 0
+    ) -> "Grid":
+        packed_rows = [bytes(row) for row in rows]
+        width = len(packed_rows[0]) if packed_rows else 0
+        grid = cls(width, len(packed_rows), padding=padding, border=border)
+        for y, row in enumerate(packed_rows):
+            if len(row) != width:
+                raise ValueError(f"Row {y} has {len(row)} cells, expected {width}")
+            grid.set_row(y, row)
+        return grid
+
+    @classmethod
+    def from_lines(
+        cls,
+        lines: Iterable[str],
+        table: bytes = DIGITS,
+        padding: int = 0,
+        border: int = 0,
+    ) -> "Grid":
+        """
+        One cell per character, mapped to a value by `table`, a `bytes.maketrans`
+        table. The default reads decimal digits.
+        """
+        return cls.from_rows(
+            (line.encode().translate(table) for line in lines), padding, border
+        )
+
+    def __getitem__(self, coordinates: tuple[int, int]) -> int:
+        return self.cells[self._checked_index(*coordinates)]
+
+    def __setitem__(self, coordinates: tuple[int, int], value: int) -> None:
+        self.cells[self._checked_index(*coordinates)] = value
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Grid):
+            return NotImplemented
+        return (self.width, self.height) == (other.width, other.height) and all(
+            a == b for a, b in zip(self.rows(), other.rows())
+        )
+
+    def index(self, x: int, y: int) -> int:
+        """
+        Unchecked, for speed: an x past either side lands in the padding or wraps
+        into the neighboring row.
+        """
+        return (y + self.padding) * self.stride + x + self.padding
+
+    def _checked_index(self, x: int, y: int) -> int:
+        if not self.in_bounds(x, y):
+            raise IndexError(f"{(x, y)} is outside the grid")
+        return self.index(x, y)
+
+    def coordinates(self, index: int) -> tuple[int, int]:
+        y, x = divmod(index, self.stride)
+        return x - self.padding, y - self.padding
+
+    def in_bounds(self, x: int, y: int) -> bool:
+        return 0 <= x < self.width and 0 <= y < self.height
+
+    def indices(self) -> Iterator[int]:
+        """Flat indices of the cells inside the grid, in row-major order."""
+        for y in range(self.height):
+            start = self.index(0, y)
+            yield from range(start, start + self.width)
+
+    def row(self, y: int) -> bytearray:
+        start = self.index(0, y)
+        return self.cells[start : start + self.width]
+
+    def rows(self) -> Iterator[bytearray]:
+        return (self.row(y) for y in range(self.height))
+
+    def set_row(self, y: int, values: bytes) -> None:
+        start = self.index(0, y)
+        self.cells[start : start + self.width] = values
+
+    def count(self, value: int) -> int:
+        """How many cells inside the grid hold `value`."""
+        return sum(row.count(value) for row in self.rows())
+
+    def copy(self) -> "Grid":
+        grid = Grid.__new__(Grid)
+        for attribute in Grid.__slots__:
+            setattr(grid, attribute, getattr(self, attribute))
+        grid.cells = self.cells[:]
+        return grid
+
+    def render(self, symbols: str = "0123456789") -> str:
+        """One line per row, drawing each value as `symbols[value]`."""
+        table = bytes.maketrans(bytes(range(len(symbols))), symbols.encode())
+        return "\n".join(row.translate(table).decode() for row in self.rows())
+
+
+def test_grid_indexing():
+    grid = Grid.from_lines(["123", "456"], padding=1, border=9)
+    assert (grid.width, grid.height, grid.stride) == (3, 2, 5)
+    assert grid[0, 0] == 1 and grid[2, 1] == 6
+    assert grid.coordinates(grid.index(2, 1)) == (2, 1)
+    assert [grid.cells[i] for i in grid.indices()] == [1, 2, 3, 4, 5, 6]
+    center = grid.index(1, 0)
+    assert [grid.cells[center + o] for o in grid.offsets4] == [9, 1, 3, 5]
+    neighbors = sorted(grid.cells[center + o] for o in grid.offsets8)
+    assert neighbors == [1, 3, 4, 5, 6, 9, 9, 9]
+    grid[1, 1] = 0
+    assert grid.render() == "123\n406"
+    assert grid.count(9) == 0
+
+
+def test_grid_copy_and_fill():
+    grid = Grid(2, 2, fill=1, padding=2)
+    assert grid.count(1) == 4 and grid.cells.count(0) == len(grid.cells) - 4
+    copy = grid.copy()
+    copy[0, 0] = 0
+    assert grid[0, 0] == 1 and grid != copy
+    assert Grid.from_rows([[1, 1], [1, 1]]) == grid
+    assert copy.render(".#") == ".#\n##"
+    with pytest.raises(ValueError):
+        grid[0, 0] = 256
+
+
+def test_grid_bounds():
+    grid = Grid.from_lines(["123", "456"])
+    for x, y in ((3, 0), (-1, 1), (0, 2), (0, -1)):
+        with pytest.raises(IndexError, match=rf"\({x}, {y}\) is outside the grid"):
+            grid[x, y]
+        with pytest.raises(IndexError):
+            grid[x, y] = 0
+    assert grid.render() == "123\n456"
+    with pytest.raises(ValueError, match="Row 1 has 2 cells, expected 3"):
+        Grid.from_lines(["123", "45", "789"])
+    with pytest.raises(ValueError, match="Row 1 has 4 cells, expected 3"):
+        Grid.from_rows([[1, 2, 3], [4, 5, 6, 7]])
@@ -1,9 +1,44 @@
 import os
+from typing import Iterator
 
 INPUTS_DIRECTORY = os.path.dirname(__file__) + "/../../inputs"
+INPUTS_DIRECTORY_VARIABLE = "AOC_INPUTS_DIRECTORY"
+
+
+def get_input_path(day_number: int) -> str:
+    """The inputs directory can be overridden with $AOC_INPUTS_DIRECTORY."""
+    directory = os.environ.get(INPUTS_DIRECTORY_VARIABLE, INPUTS_DIRECTORY)
+    return os.path.join(directory, f"{str(day_number).zfill(2)}.txt")
 
 
 def get_input_lines(day_number: int) -> list[str]:
-    input_path = os.path.join(INPUTS_DIRECTORY, f"{str(day_number).zfill(2)}.txt")
-    with open(input_path) as input_file:
-        return [line.replace("\n", "") for line in input_file.readlines()]
+    return list(iter_input_lines(day_number))
+
+
+def iter_input_lines(day_number: int) -> Iterator[str]:
+    """Yields the input one line at a time, without trailing newlines."""
+    with open(get_input_path(day_number)) as input_file:
+        for line in input_file:
+            yield line[:-1] if line.endswith("\n") else line
+
+
+class InputStream:
+    """
+    A day's input lines, read from the file afresh on every pass, so a parser that
+    goes through them once never holds the whole input.
+    """
+
+    def __init__(self, day_number: int):
+        self.day_number = day_number
+
+    def __iter__(self) -> Iterator[str]:
+        return iter_input_lines(self.day_number)
+
+
+def test_iter_input_lines(tmp_path, monkeypatch):
+    monkeypatch.setattr("solutions.common.input_reader.INPUTS_DIRECTORY", tmp_path)
+    (tmp_path / "01.txt").write_text("199\n200\n\n208")
+    assert list(iter_input_lines(1)) == ["199", "200", "", "208"]
+    assert get_input_lines(1) == ["199", "200", "", "208"]
+    stream = InputStream(1)
+    assert list(stream) == list(stream) == ["199", "200", "", "208"]
@@ -0,0 +1,239 @@
+from heapq import heapify, heappop, heappush
+from itertools import count
+from typing import Callable, Generic, Hashable, Iterable, Iterator, Optional, TypeVar
+
+import pytest
+
+
+T = TypeVar("T")
+H = TypeVar("H", bound=Hashable)
+
+REMOVED = object()
+
+
+class PriorityQueue(Generic[T]):
+    """
+    Binary heap of items ordered by an integer priority, lowest first, with ties
+    served in insertion order.
+
+    `insert` and `pop(0)` make it a drop-in for a list kept sorted by `key`: the key
+    is called exactly once per item, when it is inserted, and both are O(log n).
+    `push` adds a hashable item or lowers the priority of one already queued
+    (decrease-key), and `remove` takes one out. Superseded and removed entries are
+    deleted lazily, when they reach the top of the heap.
+    """
+
+    def __init__(
+        self, items: Iterable[T] = (), key: Optional[Callable[[T], int]] = None
+    ) -> None:
+        self.key = key
+        self._counter = count()
+        self._heap: list[list] = [
+            [self._key(item), next(self._counter), item] for item in items
+        ]
+        heapify(self._heap)
+        self._entries: dict[Hashable, list] = {}
+        self._size = len(self._heap)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[T]:
+        """Iterates over the queued items in priority order, without popping."""
+        return (entry[2] for entry in sorted(self._heap) if entry[2] is not REMOVED)
+
+    def __getitem__(self, index: int) -> T:
+        if index != 0:
+            raise IndexError("Only the front of a PriorityQueue can be read")
+        self._discard_removed()
+        if not self._heap:
+            raise IndexError("PriorityQueue is empty")
+        return self._heap[0][2]
+
+    def __contains__(self, item: Hashable) -> bool:
+        """Only items added with `push` are tracked."""
+        return item in self._entries
+
+    def _key(self, item: T) -> int:
+        if self.key is None:
+            raise TypeError("PriorityQueue needs a key to insert without a priority")
+        return self.key(item)
+
+    def _discard_removed(self) -> None:
+        while self._heap and self._heap[0][2] is REMOVED:
+            heappop(self._heap)
+
+    def insert(self, item: T, priority: Optional[int] = None) -> None:
+        """Adds the item, even if it is already queued."""
+        if priority is None:
+            priority = self._key(item)
+        heappush(self._heap, [priority, next(self._counter), item])
+        self._size += 1
+
+    def push(self, item: T, priority: Optional[int] = None) -> bool:
+        """
+        Adds a hashable item, or lowers its priority if it is already queued.
+        Returns False, changing nothing, if it is already queued at a priority no
+        higher than this one.
+        """
+        if priority is None:
+            priority = self._key(item)
+        entry = self._entries.get(item)  # type: ignore
+        if entry is not None:
+            if entry[0] <= priority:
+                return False
+            entry[2] = REMOVED
+            self._size -= 1
+        entry = [priority, next(self._counter), item]
+        self._entries[item] = entry  # type: ignore
+        heappush(self._heap, entry)
+        self._size += 1
+        return True
+
+    def remove(self, item: T) -> None:
+        """Removes an item that was added with `push`."""
+        entry = self._entries.pop(item)  # type: ignore
+        entry[2] = REMOVED
+        self._size -= 1
+
+    def pop_with_priority(self) -> tuple[int, T]:
+        self._discard_removed()
+        if not self._heap:
+            raise IndexError("pop from an empty PriorityQueue")
+        entry = heappop(self._heap)
+        priority, _, item = entry
+        self._size -= 1
+        if self._entries and self._entries.get(item) is entry:  # type: ignore
+            del self._entries[item]  # type: ignore
+        return priority, item
+
+    def pop(self, index: int = 0) -> T:
+        if index != 0:
+            raise IndexError("Only the front of a PriorityQueue can be popped")
+        return self.pop_with_priority()[1]
+
+
+class BucketQueue(Generic[H]):
+    """
+    Monotone priority queue for small non-negative integer priorities, such as
+    path costs over a grid with single-digit step costs (Dial's algorithm). Every
+    bucket holds the items of one priority, and popping only ever moves forward,
+    so each operation is O(1) amortized. Pushing below the last popped priority
+    raises ValueError.
+
+    Items must be hashable. `push` doubles as decrease-key, and superseded entries
+    are skipped when their old bucket is reached.
+    """
+
+    def __init__(self) -> None:
+        self._buckets: list[list[H]] = []
+        self._priorities: dict[H, int] = {}
+        self._cursor = 0
+
+    def __len__(self) -> int:
+        return len(self._priorities)
+
+    def __contains__(self, item: H) -> bool:
+        return item in self._priorities
+
+    def priority(self, item: H) -> int:
+        return self._priorities[item]
+
+    def push(self, item: H, priority: int) -> bool:
+        """
+        Adds the item, or lowers its priority if it is already queued. Returns False,
+        changing nothing, if it is already queued at a priority no higher than this.
+        """
+        if priority < self._cursor:
+            raise ValueError(
+                f"Priority {priority} is below the current minimum {self._cursor}"
+            )
+        priorities = self._priorities
+        current = priorities.get(item)
+        if current is not None and current <= priority:
+            return False
+        priorities[item] = priority
+        buckets = self._buckets
+        while priority >= len(buckets):
+            buckets.append([])
+        buckets[priority].append(item)
+        return True
+
+    def remove(self, item: H) -> None:
+        del self._priorities[item]
+
+    def pop_with_priority(self) -> tuple[int, H]:
+        priorities = self._priorities
+        if not priorities:
+            raise IndexError("pop from an empty BucketQueue")
+        cursor = self._cursor
+        while True:
+            bucket = self._buckets[cursor]
+            while bucket:
+                item = bucket.pop()
+                if priorities.get(item) == cursor:
+                    del priorities[item]
+                    self._cursor = cursor
+                    return cursor, item
+            cursor += 1
+
+    def pop(self) -> H:
+        return self.pop_with_priority()[1]
+
+
+def test_priority_queue_orders_by_key():
+    calls: list[int] = []
+
+    def key(x: int) -> int:
+        calls.append(x)
+        return x
+
+    queue = PriorityQueue([5, 1, 3], key)
+    for item in (4, 0, 2):
+        queue.insert(item)
+    assert len(queue) == 6
+    assert queue[0] == 0
+    assert list(queue) == [0, 1, 2, 3, 4, 5]
+    assert [queue.pop(0) for _ in range(6)] == [0, 1, 2, 3, 4, 5]
+    assert sorted(calls) == [0, 1, 2, 3, 4, 5]
+    assert not queue
+
+
+def test_priority_queue_ties_are_fifo():
+    queue: PriorityQueue[str] = PriorityQueue(key=len)
+    for word in ("bb", "a", "cc", "d"):
+        queue.insert(word)
+    assert [queue.pop() for _ in range(4)] == ["a", "d", "bb", "cc"]
+
+
+def test_priority_queue_decrease_key_and_remove():
+    queue: PriorityQueue[str] = PriorityQueue()
+    assert queue.push("a", 5)
+    assert queue.push("b", 3)
+    assert queue.push("c", 4)
+    assert not queue.push("a", 6)
+    assert queue.push("a", 1)
+    queue.remove("b")
+    assert len(queue) == 2
+    assert "b" not in queue
+    assert queue.pop_with_priority() == (1, "a")
+    assert queue.pop_with_priority() == (4, "c")
+    with pytest.raises(IndexError):
+        queue.pop()
+
+
+def test_bucket_queue():
+    queue: BucketQueue[str] = BucketQueue()
+    queue.push("a", 3)
+    queue.push("b", 1)
+    queue.push("c", 7)
+    assert queue.push("c", 2)
+    assert not queue.push("a", 4)
+    assert queue.pop_with_priority() == (1, "b")
+    queue.remove("a")
+    assert queue.pop_with_priority() == (2, "c")
+    assert len(queue) == 0
+    with pytest.raises(ValueError):
+        queue.push("d", 1)
+    queue.push("d", 2)
+    assert queue.pop() == "d"
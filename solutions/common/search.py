@@ -0,0 +1,88 @@
+from dataclasses import dataclass
+from heapq import heappop, heappush
+from typing import Callable, Hashable, Iterable, TypeVar
+
+import pytest
+
+
+S = TypeVar("S", bound=Hashable)
+
+
+@dataclass
+class SearchResult:
+    cost: int
+    # How many states were taken off the frontier and had their moves generated
+    expanded: int
+    # The most entries the frontier's heap held at once, superseded ones included
+    peak_frontier: int
+
+
+def a_star(
+    start: S,
+    goal: S,
+    neighbors: Callable[[S], Iterable[tuple[S, int]]],
+    heuristic: Callable[[S], int],
+) -> SearchResult:
+    """
+    A* over hashable states, with `neighbors` giving each next state and the cost
+    of the step to it. The heuristic must be consistent (never dropping by more
+    than a step costs), so a state is final the first time it is popped and is
+    never expanded again.
+
+    The heuristic is called once per state, however often the state is reached.
+    A push is skipped unless it improves on the best cost found so far for its
+    state; entries superseded later are dropped when they are popped. Ties on the
+    estimate go to the state reached at the higher cost, the one nearer the goal.
+
+    Memory still grows with the states reached, as A* has to remember every state
+    it has closed, but a closed state drops its best cost and estimate and is
+    only kept in the closed set. The dicts only hold states on the frontier.
+    """
+    best = {start: 0}
+    estimates = {start: heuristic(start)}
+    closed: set[S] = set()
+    frontier: list[tuple[int, int, S]] = [(estimates[start], 0, start)]
+    expanded = peak_frontier = 0
+    while frontier:
+        _, negative_cost, state = heappop(frontier)
+        cost = -negative_cost
+        if state in closed or cost > best[state]:
+            continue
+        if state == goal:
+            return SearchResult(cost, expanded, peak_frontier)
+        closed.add(state)
+        del best[state], estimates[state]
+        expanded += 1
+        for neighbor, step in neighbors(state):
+            new_cost = cost + step
+            if new_cost >= best.get(neighbor, new_cost + 1) or neighbor in closed:
+                continue
+            best[neighbor] = new_cost
+            estimate = estimates.get(neighbor)
+            if estimate is None:
+                estimate = estimates[neighbor] = heuristic(neighbor)
+            heappush(frontier, (new_cost + estimate, -new_cost, neighbor))
+        peak_frontier = max(peak_frontier, len(frontier))
+    raise ValueError("No path found to goal")
+
+
+def test_a_star():
+    # Shortest paths along a line, where moving right is cheaper two steps at once
+    def neighbors(position: int) -> list[tuple[int, int]]:
+        return [(position + 1, 3), (position + 2, 4), (position - 1, 1)]
+
+    calls: list[int] = []
+
+    def heuristic(position: int) -> int:
+        calls.append(position)
+        return max(0, 10 - position)
+
+    result = a_star(0, 10, neighbors, heuristic)
+    assert result.cost == 20
+    blind = a_star(0, 10, neighbors, lambda position: 0)
+    assert blind.cost == 20 and 0 < result.expanded < blind.expanded
+    assert result.peak_frontier > 0
+    assert len(calls) == len(set(calls))
+    assert a_star(3, 3, neighbors, heuristic) == SearchResult(0, 0, 0)
+    with pytest.raises(ValueError):
+        a_star(0, -1, lambda position: [(position + 1, 1)] * (position < 5), heuristic)
@@ -1,4 +1,11 @@
-def digest_input(input_lines: list[str]) -> list[int]:
+from typing import Iterable
+
+
+IMMUTABLE_DIGEST = True
+STREAMING_DIGEST = True
+
+
+def digest_input(input_lines: Iterable[str]) -> list[int]:
     return [int(line) for line in input_lines]
 
 
@@ -1,4 +1,11 @@
-def digest_input(input_lines: list[str]) -> list[tuple[str, int]]:
+from typing import Iterable
+
+
+IMMUTABLE_DIGEST = True
+STREAMING_DIGEST = True
+
+
+def digest_input(input_lines: Iterable[str]) -> list[tuple[str, int]]:
     return [digest_line(input_line) for input_line in input_lines]
 
 
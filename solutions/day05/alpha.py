@@ -1,7 +1,13 @@
-from solutions.common.point import Point
+from typing import Iterable
 
+from solutions.common.point import Point, pack_delta, pack_point
 
-def digest_input(input_lines: list[str]) -> list[tuple["Point", "Point"]]:
+
+IMMUTABLE_DIGEST = True
+STREAMING_DIGEST = True
+
+
+def digest_input(input_lines: Iterable[str]) -> list[tuple["Point", "Point"]]:
     digested = []
     for line in input_lines:
         start, end = line.split(" -> ", 1)
@@ -10,8 +16,8 @@ def digest_input(input_lines: list[str]) -> list[tuple["Point", "Point"]]:
 
 
 def part_one(vents: list[tuple["Point", "Point"]]) -> int:
-    ones: set[Point] = set()
-    twos: set[Point] = set()
+    ones: set[int] = set()
+    twos: set[int] = set()
     rectilinear_vents = ((v1, v2) for v1, v2 in vents if v1.x == v2.x or v1.y == v2.y)
     for vent in rectilinear_vents:
         for point in interpolate(*vent):
@@ -23,8 +29,8 @@ def part_one(vents: list[tuple["Point", "Point"]]) -> int:
 
 
 def part_two(vents: list[tuple["Point", "Point"]]) -> int:
-    ones: set[Point] = set()
-    twos: set[Point] = set()
+    ones: set[int] = set()
+    twos: set[int] = set()
     for vent in vents:
         for point in interpolate(*vent):
             if point not in ones:
@@ -34,8 +40,10 @@ def part_two(vents: list[tuple["Point", "Point"]]) -> int:
     return len(twos)
 
 
-def interpolate(start: "Point", end: "Point") -> set["Point"]:
+def interpolate(start: "Point", end: "Point") -> range:
+    """Every point on the vent, end included, packed with `pack_point`."""
     length = max(abs(start.x - end.x), abs(start.y - end.y))
     dx = (end.x - start.x) // length
     dy = (end.y - start.y) // length
-    return {Point(start.x + dx * k, start.y + dy * k) for k in range(length)} | {end}
+    step = pack_delta(dx, dy)
+    return range(pack_point(*start), pack_point(*end) + step, step)
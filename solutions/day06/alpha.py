@@ -1,3 +1,5 @@
+IMMUTABLE_DIGEST = True
+
 GESTATION_DAYS = 7
 MATURATION_DAYS = 2
 
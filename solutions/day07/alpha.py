@@ -1,3 +1,6 @@
+IMMUTABLE_DIGEST = True
+
+
 def digest_input(input_lines: list[str]) -> list[int]:
     return [int(n) for n in input_lines[0].split(",")]
 
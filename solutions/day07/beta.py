@@ -2,6 +2,9 @@ from functools import partial
 from typing import Callable
 
 
+IMMUTABLE_DIGEST = True
+
+
 def digest_input(input_lines: list[str]) -> list[int]:
     return [int(n) for n in input_lines[0].split(",")]
 
@@ -1,4 +1,12 @@
-from typing import Optional
+from typing import Iterator
+
+from solutions.common.grid import Grid
+
+
+IMMUTABLE_DIGEST = True
+
+# Higher than any height, so the edge of the map never hides a low point
+BORDER = 10
 
 
 def digest_input(input_lines: list[str]) -> list[list[int]]:
@@ -21,87 +29,51 @@ def part_one(grid: list[list[int]]) -> int:
 
 
 def part_two(grid_values: list[list[int]]) -> int:
-    grid = Grid(grid_values)
-    basin_sizes: list[int] = []
-    basined_values: set[tuple[int, int, int]] = set()
-    for ri, row in enumerate(grid_values):
-        for ci, value in enumerate(row):
-            is_minimum = (
-                (ri == 0 or grid_values[ri - 1][ci] > value)
-                and (ri == len(grid_values) - 1 or grid_values[ri + 1][ci] > value)
-                and (ci == 0 or grid_values[ri][ci - 1] > value)
-                and (ci == len(row) - 1 or grid_values[ri][ci + 1] > value)
-            )
-            if is_minimum and (ri, ci, value) not in basined_values:
-                basin: set[tuple[int, int, int]] = {(ri, ci, value)}
-                frontier = {(ri, ci, value)}
-                basined_values.add((ri, ci, value))
-                while frontier:
-                    frontier = {
-                        neighbor
-                        for ri, ci, _ in frontier
-                        for neighbor in grid.neighbors(ri, ci)
-                        if neighbor[2] != 9 and neighbor not in basin
-                    }
-                    basin |= frontier
-                    basined_values |= frontier
-                basin_sizes.append(len(basin))
-    largest_basins = sorted(basin_sizes)[-3:]
+    heightmap = Grid.from_rows(grid_values, padding=1, border=BORDER)
+    largest_basins = sorted(basin_sizes(heightmap))[-3:]
     basin_product = 1
     for basin_size in largest_basins:
         basin_product *= basin_size
     return basin_product
 
 
-class Grid:
-    def __init__(self, grid_values: list[list[int]]):
-        self.grid_values = grid_values
-
-    def left(self, row_index: int, column_index: int) -> Optional[tuple[int, int, int]]:
-        """Returns row, column, value"""
-        if column_index == 0:
-            return None
-        return (
-            row_index,
-            column_index - 1,
-            self.grid_values[row_index][column_index - 1],
-        )
-
-    def right(
-        self, row_index: int, column_index: int
-    ) -> Optional[tuple[int, int, int]]:
-        """Returns row, column, value"""
-        if column_index == len(self.grid_values[row_index]) - 1:
-            return None
-        return (
-            row_index,
-            column_index + 1,
-            self.grid_values[row_index][column_index + 1],
-        )
-
-    def up(self, row_index: int, column_index: int) -> Optional[tuple[int, int, int]]:
-        """Returns row, column, value"""
-        if row_index == 0:
-            return None
-        return (
-            row_index - 1,
-            column_index,
-            self.grid_values[row_index - 1][column_index],
-        )
+def low_points(heightmap: Grid) -> Iterator[int]:
+    """Flat indices of the cells lower than all of their neighbors"""
+    cells = heightmap.cells
+    up, left, right, down = heightmap.offsets4
+    for index in heightmap.indices():
+        height = cells[index]
+        if (
+            cells[index + up] > height
+            and cells[index + down] > height
+            and cells[index + left] > height
+            and cells[index + right] > height
+        ):
+            yield index
 
-    def down(self, row_index: int, column_index: int) -> Optional[tuple[int, int, int]]:
-        """Returns row, column, value"""
-        if row_index == len(self.grid_values) - 1:
-            return None
-        return (
-            row_index + 1,
-            column_index,
-            self.grid_values[row_index + 1][column_index],
-        )
 
-    def neighbors(self, row_index: int, column_index: int) -> set[tuple[int, int, int]]:
-        return {
-            neighbor
-            for method in (self.left, self.right, self.up, self.down)
-            if (neighbor := method(row_index, column_index)) is not None
-        }
+def basin_sizes(heightmap: Grid) -> list[int]:
+    """
+    Flood fills the basin around each low point. The heightmap must have a
+    border, which stops the fill like a height of 9 does.
+    """
+    cells = heightmap.cells
+    offsets = heightmap.offsets4
+    basined = bytearray(len(cells))
+    sizes: list[int] = []
+    for low_point in low_points(heightmap):
+        if basined[low_point]:
+            continue
+        basined[low_point] = 1
+        frontier = [low_point]
+        size = 0
+        while frontier:
+            index = frontier.pop()
+            size += 1
+            for offset in offsets:
+                neighbor = index + offset
+                if cells[neighbor] < 9 and not basined[neighbor]:
+                    basined[neighbor] = 1
+                    frontier.append(neighbor)
+        sizes.append(size)
+    return sizes
@@ -2,6 +2,9 @@ from functools import reduce
 from itertools import product
 
 
+IMMUTABLE_DIGEST = True
+
+
 def digest_input(input_lines: list[str]) -> list[list[int]]:
     return [[int(digit) for digit in row] for row in input_lines]
 
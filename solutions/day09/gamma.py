@@ -0,0 +1,135 @@
+from itertools import chain
+from typing import Iterable, Iterator
+
+
+# The digest can be a one-shot stream of rows, which each part consumes
+IMMUTABLE_DIGEST = False
+
+# Compares higher than every digit, so the edge of the map never hides a low point
+BORDER = ":"
+
+EXAMPLE = [
+    "2199943210",
+    "3987894921",
+    "9856789892",
+    "8767896789",
+    "9899965678",
+]
+
+
+def digest_input(input_lines: Iterable[str]) -> Iterable[str]:
+    """
+    The rows are consumed one at a time, so the lines can also come straight
+    from `iter_input_lines` for heightmaps too large to hold in memory.
+    """
+    return input_lines
+
+
+def part_one(rows: Iterable[str]) -> int:
+    return sum(height + 1 for _, _, height in low_points(rows))
+
+
+def low_points(rows: Iterable[str]) -> Iterator[tuple[int, int, int]]:
+    """
+    Yields the x, y and height of each low point as soon as the row below it has
+    been read. Only a window of three rows is held at a time, compared as
+    characters, with a border around the map.
+    """
+    rows = iter(rows)
+    first = next(rows, None)
+    if first is None:
+        return
+    edge = BORDER * (len(first) + 2)
+    above, current = edge, BORDER + first + BORDER
+    for y, row in enumerate(chain(rows, [None])):
+        below = edge if row is None else BORDER + row + BORDER
+        for x in range(1, len(current) - 1):
+            height = current[x]
+            if (
+                height < current[x - 1]
+                and height < current[x + 1]
+                and height < above[x]
+                and height < below[x]
+            ):
+                yield x - 1, y, int(height)
+        above, current = current, below
+
+
+def part_two(rows: Iterable[str]) -> int:
+    largest_basins = sorted(basin_sizes(rows))[-3:]
+    basin_product = 1
+    for basin_size in largest_basins:
+        basin_product *= basin_size
+    return basin_product
+
+
+def basin_sizes(rows: Iterable[str]) -> list[int]:
+    """
+    Labels the connected regions of heights below 9 in one raster sweep, with a
+    union-find over the labels of the previous and current rows only. At the end
+    of each row the labels are flattened to their roots, and the regions that did
+    not reach the row are complete, so memory stays proportional to the width.
+
+    On puzzle inputs every such region is the basin of exactly one low point.
+    """
+    sizes: list[int] = []
+    parents: dict[int, int] = {}
+    region_sizes: dict[int, int] = {}
+    next_label = 1
+
+    def find(label: int) -> int:
+        root = label
+        while parents[root] != root:
+            root = parents[root]
+        while parents[label] != root:
+            parents[label], label = root, parents[label]
+        return root
+
+    previous: list[int] = []
+    for row in rows:
+        current = [0] * len(row)
+        left = 0
+        for x, height in enumerate(row):
+            if height == "9":
+                left = 0
+                continue
+            up = previous[x] if previous else 0
+            if up and left:
+                label, other = find(up), find(left)
+                if label != other:
+                    parents[other] = label
+                    region_sizes[label] += region_sizes.pop(other)
+            elif up or left:
+                label = find(up or left)
+            else:
+                label = next_label
+                next_label += 1
+                parents[label] = label
+                region_sizes[label] = 0
+            region_sizes[label] += 1
+            current[x] = left = label
+        current = [find(label) if label else 0 for label in current]
+        reached = set(current)
+        for label in [label for label in region_sizes if label not in reached]:
+            sizes.append(region_sizes.pop(label))
+        parents = {label: label for label in region_sizes}
+        previous = current
+    sizes.extend(region_sizes.values())
+    return sizes
+
+
+def test_low_points():
+    assert list(low_points(EXAMPLE)) == [(1, 0, 1), (9, 0, 0), (2, 2, 5), (6, 4, 5)]
+    assert list(low_points(["9"])) == [(0, 0, 9)]
+    assert list(low_points([])) == []
+    assert part_one(iter(EXAMPLE)) == 15
+
+
+def test_basin_sizes():
+    assert sorted(basin_sizes(EXAMPLE)) == [3, 9, 9, 14]
+    assert sorted(basin_sizes(["191", "191", "111"])) == [7]
+    assert sorted(basin_sizes(["919", "999", "119"])) == [1, 2]
+
+
+def test_part_two():
+    assert part_two(iter(EXAMPLE)) == 1134
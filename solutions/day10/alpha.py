@@ -1,6 +1,9 @@
 from enum import Enum
 from functools import reduce
 
+IMMUTABLE_DIGEST = True
+
+
 PART_ONE_SCORE_MAPPING = {
     ")": 3,
     "]": 57,
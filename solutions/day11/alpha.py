@@ -1,4 +1,9 @@
-from itertools import product
+from solutions.common.grid import Grid
+
+
+IMMUTABLE_DIGEST = True
+
+WALL = 255
 
 
 def digest_input(input_lines: list[str]) -> list[list[int]]:
@@ -7,79 +12,62 @@ def digest_input(input_lines: list[str]) -> list[list[int]]:
 
 def part_one(octopodes: list[list[int]]) -> int:
     octopodes_grid = OctopodesGrid(octopodes)
-    flashes = 0
-    for _ in range(100):
-        octopodes_grid.increment_step()
-        flashes += len(octopodes_grid.value_addresses[0])
-    return flashes
+    return sum(octopodes_grid.increment_step() for _ in range(100))
 
 
 def part_two(octopodes: list[list[int]]) -> int:
     octopodes_grid = OctopodesGrid(octopodes)
     steps = 0
     grid_size = octopodes_grid.dimensions[0] * octopodes_grid.dimensions[1]
-    while len(octopodes_grid.value_addresses[0]) != grid_size:
-        octopodes_grid.increment_step()
+    flashed = octopodes_grid.grid.count(0)
+    while flashed != grid_size:
+        flashed = octopodes_grid.increment_step()
         steps += 1
     return steps
 
 
 class OctopodesGrid:
-    addresses: set[tuple[int, int]]
     dimensions: tuple[int, int]
-    value_addresses: dict[int, set[tuple[int, int]]]
+    grid: Grid
 
     def __init__(self, octopodes: list[list[int]]):
-        self.dimensions = (len(octopodes), len(octopodes[0]))
-        self.addresses = set(
-            product(range(self.dimensions[0]), range(self.dimensions[1]))
-        )
-        self.value_addresses: dict[int, set[tuple[int, int]]] = {
-            x: set() for x in range(10)
-        }
-        for ri, row in enumerate(octopodes):
-            for ci, octopus in enumerate(row):
-                self.value_addresses[octopus].add((ri, ci))
-
-    def increment_step(self) -> None:
-        self.value_addresses.update(
-            {k + 1: v for k, v in self.value_addresses.items()} | {0: set()}
-        )
-        while self.value_addresses[10]:
-            addresses_to_increment = [
-                (r + dr, c + dc)
-                for r, c in self.value_addresses[10]
-                for dr in range(-1, 2)
-                for dc in range(-1, 2)
-                if (dr != 0 or dc != 0) and (r + dr, c + dc) in self.addresses
-            ]
-            self.value_addresses[0].update(self.value_addresses[10])
-            self.value_addresses[10] = set()
-            for address_to_increment in addresses_to_increment:
-                self._charge_octopus_at(address_to_increment)
-        self.value_addresses.pop(10, None)
-
-    def _charge_octopus_at(self, address: tuple[int, int]) -> None:
-        octo_value = next(
-            (
-                value
-                for value, addresses_with_value in self.value_addresses.items()
-                if 1 <= value <= 9 and address in addresses_with_value
-            ),
-            None,
-        )
-        if octo_value is not None:
-            self.value_addresses[octo_value].remove(address)
-            self.value_addresses[octo_value + 1].add(address)
+        self.grid = Grid.from_rows(octopodes, padding=1, border=WALL)
+        self.dimensions = (self.grid.height, self.grid.width)
+
+    def increment_step(self) -> int:
+        """Returns how many octopodes flashed"""
+        cells = self.grid.cells
+        offsets = self.grid.offsets8
+        flashing = []
+        for index in self.grid.indices():
+            cells[index] += 1
+            if cells[index] == 10:
+                flashing.append(index)
+        flashed = flashing[:]
+        while flashing:
+            index = flashing.pop()
+            for offset in offsets:
+                neighbor = index + offset
+                if cells[neighbor] < 10:
+                    cells[neighbor] += 1
+                    if cells[neighbor] == 10:
+                        flashing.append(neighbor)
+                        flashed.append(neighbor)
+        for index in flashed:
+            cells[index] = 0
+        return len(flashed)
+
+    @property
+    def value_addresses(self) -> dict[int, set[tuple[int, int]]]:
+        """The (row, column) address of every octopus, by energy level"""
+        value_addresses: dict[int, set[tuple[int, int]]] = {x: set() for x in range(10)}
+        for index in self.grid.indices():
+            column, row = self.grid.coordinates(index)
+            value_addresses[self.grid.cells[index]].add((row, column))
+        return value_addresses
 
     def render(self) -> str:
-        print_grid: list[list[str]] = [
-            ["." for _ in range(self.dimensions[1])] for _ in range(self.dimensions[0])
-        ]
-        for value, addresses in self.value_addresses.items():
-            for row, column in addresses:
-                print_grid[row][column] = str(value)
-        return "\n".join("".join(octo for octo in row) for row in print_grid)
+        return self.grid.render()
 
 
 PART_ONE_TEST_INPUT = [
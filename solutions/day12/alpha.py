@@ -1,6 +1,9 @@
 import pytest
 
 
+IMMUTABLE_DIGEST = True
+
+
 def digest_input(input_lines: list[str]) -> dict[str, set[str]]:
     nodes: dict[str, set[str]] = {}
     for input_line in input_lines:
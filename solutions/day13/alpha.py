@@ -2,6 +2,10 @@ from dataclasses import dataclass
 from enum import Enum
 import pytest
 
+from solutions.common.grid import Grid
+
+
+IMMUTABLE_DIGEST = True
 
 BOLD = "\033[1m"
 PLAIN = "\033[0m"
@@ -70,12 +74,11 @@ def part_two(points_folds: tuple[list["Point"], list["Fold"]]) -> str:
         for point in points_to_reflect:
             points.remove(point)
             points.add(reflect(point, fold))
-    width, height = (max(p.x for p in points) + 1, max(p.y for p in points) + 1)
-    display_string = "\n".join(
-        "".join(
-            f"{BOLD}⌼⌼{PLAIN}" if Point(x, y) in points else ".." for x in range(width)
-        )
-        for y in range(height)
+    paper = Grid(max(p.x for p in points) + 1, max(p.y for p in points) + 1)
+    for point in points:
+        paper[point.x, point.y] = 1
+    display_string = (
+        paper.render(".#").replace(".", "..").replace("#", f"{BOLD}⌼⌼{PLAIN}")
     )
     return f"\n{display_string}"
 
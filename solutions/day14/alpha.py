@@ -3,6 +3,9 @@ from collections import Counter
 import pytest
 
 
+IMMUTABLE_DIGEST = True
+
+
 def digest_input(input_lines: list[str]) -> tuple[str, dict[str, str]]:
     base = input_lines[0]
     insertions: dict[str, str] = {}
@@ -1,8 +1,13 @@
 import time
-from typing import Callable, Iterator, Optional
+from typing import Iterator
 
 import pytest
 
+from solutions.common.priority_queue import PriorityQueue
+
+
+IMMUTABLE_DIGEST = True
+
 
 class Position:
     x: int
@@ -94,7 +99,7 @@ class Pathfinder:
     start: Position
     end: Position
     visited: dict[tuple[int, int], int]
-    paths: list[Path]
+    paths: PriorityQueue[Path]
 
     def __init__(self, positions: list[Position]):
         self.start = min(positions, key=lambda p: p.address)
@@ -104,7 +109,9 @@ class Pathfinder:
             p.address: self.size for p in positions
         }
         self.visited[self.start.address] = 0
-        self.paths = [Path({self.start.address}, self.start, 0)]
+        self.paths = PriorityQueue(
+            [Path({self.start.address}, self.start, 0)], self.heuristic
+        )
 
     def heuristic(self, path: Path) -> int:
         return path.risk + (self.end.y - path.tail.y + self.end.x - path.tail.x)
@@ -118,7 +125,7 @@ class Pathfinder:
             expansions = self.expand_path(path)
             self.visited.update({exp.tail.address: exp.risk for exp in expansions})
             for exp in expansions:
-                sorted_insert(self.paths, exp, self.heuristic)
+                self.paths.insert(exp)
             done = any(exp.tail == self.end for exp in expansions)
             if report:
                 count += 1
@@ -177,19 +184,6 @@ def expand_five_times(positions: list[Position]) -> list[Position]:
     return list(full_map_dict.values())
 
 
-def sorted_insert(paths: list[Path], new_path: Path, key: Callable[[Path], int]):
-    left = 0
-    right = len(paths)
-    new_path_value = key(new_path)
-    while right > left + 1:
-        test_index = (right + left) // 2
-        if key(paths[test_index]) > new_path_value:
-            right = test_index
-        else:
-            left = test_index
-    paths[right:right] = [new_path]
-
-
 TEST_INPUT = [
     "1163751742",
     "1381373672",
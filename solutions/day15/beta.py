@@ -0,0 +1,227 @@
+from array import array
+from typing import Union
+
+import pytest
+
+from solutions.common.grid import Grid
+from solutions.common.priority_queue import BucketQueue
+
+
+IMMUTABLE_DIGEST = True
+
+# Risks run from 1 to 9, so a zero border marks the edge of the cave
+WALL = 0
+UNREACHED = 2**31 - 1
+NO_PREDECESSOR = -1
+MAX_RISK = 9
+
+EXAMPLE = [
+    "1163751742",
+    "1381373672",
+    "2136511328",
+    "3694931569",
+    "7463417111",
+    "1319128137",
+    "1359912421",
+    "3125421639",
+    "1293138521",
+    "2311944581",
+]
+
+
+def digest_input(input_lines: list[str]) -> Grid:
+    return Grid.from_lines(input_lines, padding=1, border=WALL)
+
+
+def part_one(risks: Grid) -> int:
+    return lowest_total_risk(risks)
+
+
+def part_two(risks: Grid) -> int:
+    return lowest_total_risk(TiledRisks(risks, 5))
+
+
+def lowest_total_risk(risks: Union[Grid, "TiledRisks"]) -> int:
+    """The lowest total risk from the top left to the bottom right corner"""
+    return DistanceField(risks).risk_to(risks.width - 1, risks.height - 1)
+
+
+class DistanceField:
+    """
+    Lowest total risks from one start cell, by Dijkstra's algorithm over flat
+    indices into the padded risk grid. Every step costs 1 to 9, so the frontier is
+    a BucketQueue (Dial's algorithm).
+
+    Every distance and predecessor is kept in flat arrays, and the search can be
+    paused: a query settles cells only until its target is settled, and later
+    queries resume from there. A map is never searched twice, however many
+    targets are asked for.
+    """
+
+    def __init__(
+        self, risks: Union[Grid, "TiledRisks"], start: tuple[int, int] = (0, 0)
+    ):
+        self.risks = risks
+        self._cells = risks.cells if isinstance(risks, Grid) else risks
+        size = len(self._cells)
+        self.start = self._index(*start)
+        self.distances = array("i", [UNREACHED]) * size
+        self.predecessors = array("i", [NO_PREDECESSOR]) * size
+        self._settled = bytearray(size)
+        self._frontier: BucketQueue[int] = BucketQueue()
+        self.distances[self.start] = 0
+        self._frontier.push(self.start, 0)
+
+    def risk_to(self, x: int, y: int) -> int:
+        """The lowest total risk of entering (x, y) on the way from the start"""
+        target = self._index(x, y)
+        self._settle(target)
+        return self.distances[target]
+
+    def path_to(self, x: int, y: int) -> list[tuple[int, int]]:
+        """The cells of a least risky path from the start to (x, y), both included"""
+        index = self._index(x, y)
+        self._settle(index)
+        path = []
+        while index != NO_PREDECESSOR:
+            path.append(self.risks.coordinates(index))
+            index = self.predecessors[index]
+        return path[::-1]
+
+    def _index(self, x: int, y: int) -> int:
+        # A flat index past the right edge would wrap into the next row
+        if not self.risks.in_bounds(x, y):
+            raise ValueError(f"{(x, y)} is not on the map")
+        return self.risks.index(x, y)
+
+    def _settle(self, target: int) -> None:
+        cells = self._cells
+        offsets = self.risks.offsets4
+        distances = self.distances
+        predecessors = self.predecessors
+        settled = self._settled
+        frontier = self._frontier
+        while not settled[target]:
+            if not frontier:
+                raise ValueError("No path found to target")
+            distance, index = frontier.pop_with_priority()
+            settled[index] = 1
+            for offset in offsets:
+                neighbor = index + offset
+                risk = cells[neighbor]
+                if risk != WALL and distance + risk < distances[neighbor]:
+                    distances[neighbor] = distance + risk
+                    predecessors[neighbor] = index
+                    frontier.push(neighbor, distance + risk)
+
+
+class TiledRisks:
+    """
+    A lazy view of the full map: `factor` copies of the tile across and down,
+    each one's risks raised by its tile row plus tile column, wrapping from 9 back
+    to 1. Risks are worked out from the tile when they are read, so the full map
+    is never built.
+
+    It is indexed like a Grid with a padding of one WALL cell, by flat index
+    into the full map, and `lowest_total_risk` searches it the same way.
+    """
+
+    def __init__(self, tile: Grid, factor: int):
+        self.tile = tile
+        self.width = tile.width * factor
+        self.height = tile.height * factor
+        self.stride = self.width + 2
+        self.offsets4 = (-self.stride, -1, 1, self.stride)
+        risk_levels = bytes(range(1, MAX_RISK + 1))
+        self._raised = [
+            bytes.maketrans(risk_levels, risk_levels[k % 9 :] + risk_levels[: k % 9])
+            for k in range(2 * factor - 1)
+        ]
+
+    def __len__(self) -> int:
+        return self.stride * (self.height + 2)
+
+    def __getitem__(self, index: int) -> int:
+        y, x = divmod(index, self.stride)
+        if not (0 < x <= self.width and 0 < y <= self.height):
+            return WALL
+        tile = self.tile
+        tile_y, y = divmod(y - 1, tile.height)
+        tile_x, x = divmod(x - 1, tile.width)
+        return self._raised[tile_x + tile_y][tile.cells[tile.index(x, y)]]
+
+    def index(self, x: int, y: int) -> int:
+        return (y + 1) * self.stride + x + 1
+
+    def coordinates(self, index: int) -> tuple[int, int]:
+        y, x = divmod(index, self.stride)
+        return x - 1, y - 1
+
+    def in_bounds(self, x: int, y: int) -> bool:
+        return 0 <= x < self.width and 0 <= y < self.height
+
+    def rows(self) -> list[bytes]:
+        return [
+            bytes(self[self.index(x, y)] for x in range(self.width))
+            for y in range(self.height)
+        ]
+
+
+def test_lowest_total_risk():
+    assert part_one(digest_input(EXAMPLE)) == 40
+    assert part_one(digest_input(["19", "11"])) == 2
+    assert part_two(digest_input(EXAMPLE)) == 315
+
+
+def test_distance_field():
+    risks = digest_input(EXAMPLE)
+    field = DistanceField(risks)
+    assert field.risk_to(0, 0) == 0
+    assert field.risk_to(9, 9) == 40
+    assert field.risk_to(3, 0) == 10
+    path = field.path_to(9, 9)
+    assert path[0] == (0, 0) and path[-1] == (9, 9)
+    assert sum(risks[cell] for cell in path[1:]) == 40
+    steps = zip(path, path[1:])
+    assert all(abs(x1 - x2) + abs(y1 - y2) == 1 for (x1, y1), (x2, y2) in steps)
+    # Walking the same path backwards enters the start instead of the end
+    tiled = TiledRisks(risks, 5)
+    backwards = DistanceField(tiled, start=(49, 49))
+    assert backwards.risk_to(0, 0) == 315 - tiled[tiled.index(49, 49)] + risks[0, 0]
+    for x, y in [(10, 0), (12, 0), (-2, 2), (0, 10)]:
+        with pytest.raises(ValueError, match=rf"\({x}, {y}\) is not on the map"):
+            field.risk_to(x, y)
+        with pytest.raises(ValueError):
+            field.path_to(x, y)
+    with pytest.raises(ValueError):
+        backwards.risk_to(52, 0)
+    with pytest.raises(ValueError):
+        DistanceField(risks, start=(12, 0))
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_searches_match_alpha(seed):
+    from solutions.common.generators import generate_input
+    from solutions.day15 import alpha
+
+    input_lines = generate_input(15, 0.02, seed=seed)
+    expected = [
+        alpha.part_one(alpha.digest_input(input_lines)),
+        alpha.part_two(alpha.digest_input(input_lines)),
+    ]
+    risks = digest_input(input_lines)
+    for risk_map, risk in zip([risks, TiledRisks(risks, 5)], expected):
+        assert lowest_total_risk(risk_map) == risk
+        field = DistanceField(risk_map)
+        assert field.risk_to(risk_map.width - 1, risk_map.height - 1) == risk
+
+
+def test_tiled_risks():
+    from solutions.day15 import alpha
+
+    tiled = TiledRisks(digest_input(["8"]), 3)
+    assert tiled.rows() == [bytes([8, 9, 1]), bytes([9, 1, 2]), bytes([1, 2, 3])]
+    assert tiled[0] == tiled[tiled.index(3, 0)] == WALL
+    expanded = alpha.expand_five_times(alpha.digest_input(EXAMPLE))
+    tiled = TiledRisks(digest_input(EXAMPLE), 5)
+    assert all(tiled[tiled.index(p.x, p.y)] == p.risk for p in expanded)
@@ -5,6 +5,9 @@ from functools import reduce
 import pytest
 
 
+IMMUTABLE_DIGEST = True
+
+
 class Operator(Enum):
     SUM = 0
     PRODUCT = 1
@@ -1,8 +1,11 @@
-from enum import Enum
+from math import isqrt
 import re
 from typing import Optional
 
-from solutions.common.point import BoundingBox, Point
+from solutions.common.point import BoundingBox
+
+
+IMMUTABLE_DIGEST = True
 
 
 def digest_input(input_lines: list[str]) -> BoundingBox:
@@ -16,26 +19,7 @@ def digest_input(input_lines: list[str]) -> BoundingBox:
 
 
 def part_one(bounding_box: BoundingBox) -> int:
-    min_x_velocity = calculate_minimum_x_velocity(bounding_box.x1)
-    max_x_velocity = bounding_box.x2
-    highest_shot = 0
-    for dx in range(min_x_velocity, max_x_velocity + 1):
-        overshot = False
-        dy = bounding_box.y1 - 1
-        while not overshot and dy < -(bounding_box.y1):
-            dy += 1
-            height, shot_result = calculate_arc(dx, dy, bounding_box)
-            if shot_result is ShotResult.HIT and highest_shot < height:
-                highest_shot = height
-            else:
-                overshot = shot_result is ShotResult.OVERSHOT
-    return highest_shot
-
-
-class ShotResult(Enum):
-    MISS = 0
-    HIT = 1
-    OVERSHOT = 2
+    return max((highest_point(dy) for dy in find_hits(bounding_box)), default=0)
 
 
 def calculate_minimum_x_velocity(left_bound: int) -> int:
@@ -45,38 +29,88 @@ def calculate_minimum_x_velocity(left_bound: int) -> int:
     return x
 
 
-def calculate_arc(dx: int, dy: int, target: BoundingBox) -> tuple[int, ShotResult]:
-    """Returns highest point and the result"""
-    x, y = 0, 0
-    max_height = 0
-    while x <= target.x2 and y >= target.y1:
-        x += dx
-        if dx > 0:
-            dx -= 1
-        y += dy
-        dy -= 1
-        if y > max_height:
-            max_height = y
-        if x > target.x2 and y > target.y2:
-            return max_height, ShotResult.OVERSHOT
-        if target.contains(Point(x, y)):
-            return max_height, ShotResult.HIT
-        if y < target.y1 or x > target.x2:
-            return max_height, ShotResult.MISS
+def find_hits(target: BoundingBox) -> list[int]:
+    """
+    Returns the vertical velocity of every shot that hits, once per hit.
+
+    The probe is level with the target during one window of steps that depends
+    on the vertical velocity only, and in line with it during one that depends on
+    the horizontal velocity only. A shot hits when its two windows overlap, so
+    the windows are worked out once per velocity and every vertical window is
+    then intersected with each horizontal one.
+    """
+    y_velocities, starts, ends = [], [], []
+    for dy in range(target.y1, -target.y1 + 1):
+        start = first_step_below(dy, target.y2 + 1)
+        end = first_step_below(dy, target.y1) - 1
+        if start <= end:
+            y_velocities.append(dy)
+            starts.append(start)
+            ends.append(end)
+    if not y_velocities:
+        return []
+    last_end = max(ends)
+    hits: list[int] = []
+    for dx in range(calculate_minimum_x_velocity(target.x1), target.x2 + 1):
+        first = first_step_past(dx, target.x1 - 1)
+        if first is None:
+            continue
+        passed = first_step_past(dx, target.x2)
+        last = last_end if passed is None else passed - 1
+        if first > last:
+            continue
+        hits.extend(
+            dy
+            for dy, start, end in zip(y_velocities, starts, ends)
+            if max(start, first) <= min(end, last)
+        )
+    return hits
+
+
+def x_position(dx: int, step: int) -> int:
+    step = min(step, dx)
+    return step * dx - step * (step - 1) // 2
+
+
+def y_position(dy: int, step: int) -> int:
+    return step * dy - step * (step - 1) // 2
+
+
+def highest_point(dy: int) -> int:
+    return y_position(dy, dy) if dy > 0 else 0
+
+
+def first_step_below(dy: int, level: int) -> int:
+    """The first step that ends below `level`, which must not be above the start"""
+    # y(step) < level past the larger root of step^2 - (2dy + 1)step + 2level
+    b = 2 * dy + 1
+    step = max((b + isqrt(b * b - 8 * level)) // 2, 1)
+    while y_position(dy, step) >= level:
+        step += 1
+    while step > 1 and y_position(dy, step - 1) < level:
+        step -= 1
+    return step
+
+
+def first_step_past(dx: int, right: int) -> Optional[int]:
+    """The first step that ends right of `right`, or None if x stalls before it"""
+    if x_position(dx, dx) <= right:
+        return None
+    # x(step) > right past the smaller root of step^2 - (2dx + 1)step + 2(right + 1)
+    b = 2 * dx + 1
+    step = max((b - isqrt(b * b - 8 * (right + 1))) // 2, 1)
+    while x_position(dx, step) <= right:
+        step += 1
+    while step > 1 and x_position(dx, step - 1) > right:
+        step -= 1
+    return step
 
 
 def part_two(bounding_box: BoundingBox) -> int:
-    min_x_velocity = calculate_minimum_x_velocity(bounding_box.x1)
-    max_x_velocity = bounding_box.x2
-    count = 0
-    for dx in range(min_x_velocity, max_x_velocity + 1):
-        overshot = False
-        dy = bounding_box.y1 - 1
-        while not overshot and dy < -(bounding_box.y1):
-            dy += 1
-            height, shot_result = calculate_arc(dx, dy, bounding_box)
-            if shot_result is ShotResult.HIT:
-                count += 1
-            else:
-                overshot = shot_result is ShotResult.OVERSHOT
-    return count
+    return len(find_hits(bounding_box))
+
+
+def test_example():
+    bounding_box = digest_input(["target area: x=20..30, y=-10..-5"])
+    assert part_one(bounding_box) == 45
+    assert part_two(bounding_box) == 112
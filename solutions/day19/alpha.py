@@ -1,10 +1,14 @@
 from dataclasses import dataclass
+from functools import partial
 from itertools import product
-from typing import Optional
+from typing import Callable, Optional
 
 import pytest
 
 
+Matrix = tuple[tuple[int, int, int], ...]
+
+
 def digest_input(input_lines: list[str]) -> list["Scanner"]:
     scanners: list[Scanner] = []
     new_beacons: list[Vector] = []
@@ -102,19 +106,76 @@ class Vector:
         return abs(self.x) + abs(self.y) + abs(self.z)
 
 
+IDENTITY: Matrix = ((1, 0, 0), (0, 1, 0), (0, 0, 1))
+# Quarter turns, as in `Scanner.roll`, `Scanner.yaw` and `Scanner.pitch`
+ROLL: Matrix = ((0, -1, 0), (1, 0, 0), (0, 0, 1))
+YAW: Matrix = ((0, 0, 1), (0, 1, 0), (-1, 0, 0))
+PITCH: Matrix = ((1, 0, 0), (0, 0, 1), (0, -1, 0))
+
+
+def matrix_product(a: Matrix, b: Matrix) -> Matrix:
+    def entry(i: int, j: int) -> int:
+        return sum(a[i][k] * b[k][j] for k in range(3))
+
+    return tuple((entry(i, 0), entry(i, 1), entry(i, 2)) for i in range(3))
+
+
+def rotation_matrices() -> list[Matrix]:
+    """
+    The 24 orientations, in the order the scanner used to be turned through them:
+    four rolls about each of the six directions z can face.
+    """
+    turns: list[tuple[Matrix, ...]] = [()] + [(ROLL,)] * 3
+    for quarter in (YAW, YAW, YAW, PITCH):
+        turns += [(ROLL, quarter)] + [(ROLL,)] * 3
+    turns += [(PITCH, PITCH)] + [(ROLL,)] * 3
+    matrices = []
+    matrix = IDENTITY
+    for turn in turns:
+        for quarter in turn:
+            matrix = matrix_product(quarter, matrix)
+        matrices.append(matrix)
+    return matrices
+
+
+ROTATIONS = rotation_matrices()
+
+
+def rotate_all(beacons: list["Vector"], matrices: list[Matrix]) -> list[list["Vector"]]:
+    """The beacons under each of the matrices, unpacking each matrix once."""
+    return [
+        [
+            Vector(
+                xx * b.x + xy * b.y + xz * b.z,
+                yx * b.x + yy * b.y + yz * b.z,
+                zx * b.x + zy * b.y + zz * b.z,
+            )
+            for b in beacons
+        ]
+        for (xx, xy, xz), (yx, yy, yz), (zx, zy, zz) in matrices
+    ]
+
+
 class Scanner:
     """
     z is forward
     x is right
     y is up
+
+    The beacons under every rotation in ROTATIONS, and their relative positions,
+    are worked out once per scanner and kept, so `match_any_rotation` only picks
+    among them however often the scanner is matched.
     """
 
     _relative_positions: Optional[tuple[set[Vector], ...]]
+    _oriented_relatives: dict[int, tuple[set[Vector], ...]]
 
     def __init__(self, beacons: list[Vector], name: str = ""):
         self.beacons = beacons
         self._original_beacons = beacons[:]
         self._relative_positions = None
+        self._orientations: Optional[list[list[Vector]]] = None
+        self._oriented_relatives = {}
         self.name = name or f"{beacons[0]} and {len(beacons)} others"
 
     def __repr__(self) -> str:
@@ -129,6 +190,27 @@ class Scanner:
             )
         return self._relative_positions
 
+    @property
+    def orientations(self) -> list[list[Vector]]:
+        """The original beacons under each rotation in ROTATIONS."""
+        if self._orientations is None:
+            self._orientations = rotate_all(self._original_beacons, ROTATIONS)
+        return self._orientations
+
+    def orient(self, index: int) -> "Scanner":
+        """Turns the original beacons by ROTATIONS[index]."""
+        self.beacons = self.orientations[index]
+        self._relative_positions = self._oriented_relatives.get(index)
+        if self._relative_positions is None:
+            self._oriented_relatives[index] = self.relative_positions
+        return self
+
+    def rotate(self, matrix: Matrix, count: int = 1) -> "Scanner":
+        for _ in range(count % 4):
+            (self.beacons,) = rotate_all(self.beacons, [matrix])
+        self._relative_positions = None
+        return self
+
     def yaw(self, count: int = 1) -> "Scanner":
         """
         Yaw left (counterclockwise) 90 degrees count times.
@@ -136,16 +218,7 @@ class Scanner:
         -x becomes z
         y remains
         """
-        count %= 4
-
-        def isometry(beacon: Vector) -> Vector:
-            for _ in range(count):
-                beacon = Vector(beacon.z, beacon.y, -beacon.x)
-            return beacon
-
-        self.beacons = [isometry(beacon) for beacon in self.beacons]
-        self._relative_positions = None
-        return self
+        return self.rotate(YAW, count)
 
     def roll(self, count: int = 1) -> "Scanner":
         """
@@ -154,16 +227,7 @@ class Scanner:
         x becomes y
         -y becomes x
         """
-        count %= 4
-
-        def isometry(beacon: Vector) -> Vector:
-            for _ in range(count):
-                beacon = Vector(-beacon.y, beacon.x, beacon.z)
-            return beacon
-
-        self.beacons = [isometry(beacon) for beacon in self.beacons]
-        self._relative_positions = None
-        return self
+        return self.rotate(ROLL, count)
 
     def pitch(self, count: int = 1) -> "Scanner":
         """
@@ -172,25 +236,17 @@ class Scanner:
         -y becomes z
         x remains
         """
-        count %= 4
-
-        def isometry(beacon: Vector) -> Vector:
-            for _ in range(count):
-                beacon = Vector(beacon.x, beacon.z, -beacon.y)
-            return beacon
-
-        self.beacons = [isometry(beacon) for beacon in self.beacons]
-        self._relative_positions = None
-        return self
+        return self.rotate(PITCH, count)
 
     def match(self, other: "Scanner") -> Optional["Vector"]:
         """
         Returns Vector to other Scanner if 12 beacons can be matched.
         """
+        other_relatives = other.relative_positions
         for i, beacon in enumerate(self.beacons):
             relative_positions = self.relative_positions[i]
             for j, other_beacon in enumerate(other.beacons):
-                other_relative_positions = other.relative_positions[j]
+                other_relative_positions = other_relatives[j]
                 common_count = len(relative_positions & other_relative_positions)
                 if common_count >= 12:
                     return other_beacon - beacon
@@ -198,23 +254,15 @@ class Scanner:
             return None
 
     def match_any_rotation(self, other: "Scanner") -> Optional["Vector"]:
-        for rotation in self.all_rotations():
-            rotation()
-            match = self.match(other)
+        """Leaves the scanner turned to the rotation that matched, if any."""
+        for index in range(len(ROTATIONS)):
+            match = self.orient(index).match(other)
             if match is not None:
                 return match
         return None
 
-    def all_rotations(self):
-        rotations = (
-            (lambda: None, self.roll, self.roll, self.roll)
-            + (lambda: self.roll().yaw(), self.roll, self.roll, self.roll)
-            + (lambda: self.roll().yaw(), self.roll, self.roll, self.roll)
-            + (lambda: self.roll().yaw(), self.roll, self.roll, self.roll)
-            + (lambda: self.roll().pitch(), self.roll, self.roll, self.roll)
-            + (lambda: self.pitch(2), self.roll, self.roll, self.roll)
-        )
-        return rotations
+    def all_rotations(self) -> list[Callable[[], "Scanner"]]:
+        return [partial(self.orient, index) for index in range(len(ROTATIONS))]
 
 
 @pytest.fixture
@@ -280,5 +328,28 @@ def test_all_rotations(vectuples):
         beacons_under_rotation.update(beacon_set)
 
 
+def test_rotation_matrices(vectuples):
+    assert len(set(ROTATIONS)) == 24 and ROTATIONS[0] == IDENTITY
+    beacons = [Vector(*v) for v in vectuples]
+    scanner = Scanner(beacons[:])
+    for matrix, orientation in zip(ROTATIONS, scanner.orientations):
+        coordinates = [(b.x, b.y, b.z) for b in beacons]
+        assert [
+            Vector(*(sum(m * c for m, c in zip(row, point)) for row in matrix))
+            for point in coordinates
+        ] == orientation
+    # Four rolls bring z back to forward, then the next yaw makes it two in all
+    scanner.yaw(2)
+    assert scanner.beacons == scanner.orientations[8]
+
+
+def test_orient_keeps_relative_positions(vectuples):
+    scanner = Scanner([Vector(*v) for v in vectuples])
+    first = scanner.orient(5).relative_positions
+    scanner.orient(0)
+    assert scanner.orient(5).relative_positions is first
+    assert first == Scanner(scanner.orientations[5]).relative_positions
+
+
 def test_part_two(example):
     assert part_two(digest_input(example)) == 3621
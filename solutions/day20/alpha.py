@@ -1,64 +1,67 @@
 import pytest
 
+from solutions.common.grid import Grid
 
-def digest_input(input_lines: list[str]) -> "Grid":
-    algorithm = tuple(c == "#" for c in input_lines[0])
-    grid = [[c == "#" for c in row] for row in input_lines[2:]]
-    return Grid(algorithm, grid)
 
+PIXELS = bytes.maketrans(b".#", b"\x00\x01")
 
-class Grid:
-    def __init__(self, algorithm: tuple[bool, ...], grid_values: list[list[bool]]):
-        self.grid_dict = {
-            (x, y): value
-            for y, row in enumerate(grid_values)
-            for x, value in enumerate(row)
-        }
-        self.size = (len(grid_values[0]), len(grid_values))
+
+def digest_input(input_lines: list[str]) -> "Image":
+    algorithm = input_lines[0].encode().translate(PIXELS)
+    return Image(algorithm, Grid.from_lines(input_lines[2:], PIXELS, padding=2))
+
+
+class Image:
+    """
+    The pixels are kept with two rings of padding holding the color of the
+    infinite background, so every 3x3 neighborhood of the next, larger image can
+    be read without bounds checks.
+    """
+
+    def __init__(self, algorithm: bytes, pixels: Grid):
         self.algorithm = algorithm
-        self.default = False
+        self.pixels = pixels
 
     def iterate(self) -> None:
-        new_dict: dict[tuple[int, int], bool] = {}
-        self.grid_dict.update(
-            {(i - 1, -1): self.default for i in range(self.size[0] + 2)}
-            | {(i - 1, self.size[1]): self.default for i in range(self.size[0] + 2)}
-            | {(-1, j - 1): self.default for j in range(self.size[1] + 2)}
-            | {(self.size[0], j - 1): self.default for j in range(self.size[1] + 2)}
-        )
-        for address, value in self.grid_dict.items():
-            x, y = address
-            neighborhood = (
-                self.grid_dict.get((x + dx, y + dy), self.default)
-                for dy in range(-1, 2)
-                for dx in range(-1, 2)
-            )
-            algorithm_index = int("".join(map(str, map(int, neighborhood))), 2)
-            new_value = self.algorithm[algorithm_index]
-            new_dict[(x + 1, y + 1)] = new_value
-        self.size = (self.size[0] + 2, self.size[1] + 2)
-        self.grid_dict = new_dict
-        self.default = self.algorithm[1 - 2 * self.default]
+        old = self.pixels
+        cells = old.cells
+        stride = old.stride
+        algorithm = self.algorithm
+        default = algorithm[511 if old.border else 0]
+        new = Grid(old.width + 2, old.height + 2, padding=2, border=default)
+        new_cells = new.cells
+        for y in range(new.height):
+            # The new pixel (x, y) is centered on the old pixel (x - 1, y - 1), so
+            # its neighborhood starts in the old row y - 2 at the old column x - 2
+            top = old.index(-2, y - 2)
+            middle = top + stride
+            bottom = middle + stride
+            code = 0
+            for x in range(new.width + 2):
+                code = (
+                    ((code << 1) & 0b110110110)
+                    | cells[top + x] << 6
+                    | cells[middle + x] << 3
+                    | cells[bottom + x]
+                )
+                if x >= 2:
+                    new_cells[new.index(x - 2, y)] = algorithm[code]
+        self.pixels = new
 
     def print(self) -> str:
-        print_grid: list[list[str]] = [
-            ["."] * self.size[0] for _ in range(self.size[1])
-        ]
-        for address, value in self.grid_dict.items():
-            print_grid[address[1]][address[0]] = "#" if value else "."
-        return "\n".join("".join(row) for row in print_grid)
+        return self.pixels.render(".#")
 
 
-def part_one(grid: "Grid") -> int:
-    grid.iterate()
-    grid.iterate()
-    return sum(grid.grid_dict.values())
+def part_one(image: "Image") -> int:
+    image.iterate()
+    image.iterate()
+    return image.pixels.count(1)
 
 
-def part_two(grid: "Grid") -> int:
+def part_two(image: "Image") -> int:
     for _ in range(50):
-        grid.iterate()
-    return sum(grid.grid_dict.values())
+        image.iterate()
+    return image.pixels.count(1)
 
 
 @pytest.fixture
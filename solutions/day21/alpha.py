@@ -3,6 +3,9 @@ from dataclasses import dataclass
 import pytest
 
 
+IMMUTABLE_DIGEST = True
+
+
 def digest_input(input_lines: list[str]) -> tuple[int, int]:
     return (
         int(input_lines[0].rsplit(" ", 1)[-1]),
@@ -1,9 +1,12 @@
 from dataclasses import dataclass, field
 import re
-from typing import Optional
+from typing import Iterable, Optional
 
 
-def digest_input(input_lines: list[str]) -> list["Cuboid"]:
+STREAMING_DIGEST = True
+
+
+def digest_input(input_lines: Iterable[str]) -> list["Cuboid"]:
     regex = r"(on|off) x=(-?\d+)\.\.(-?\d+),y=(-?\d+)\.\.(-?\d+),z=(-?\d+)\.\.(-?\d+)"
     cuboids: list[Cuboid] = []
     for input_line in input_lines:
@@ -1,11 +1,12 @@
-from copy import deepcopy
 from dataclasses import dataclass
+import random
 import re
-from typing import Optional
+from typing import Iterator, Optional
 
 import pytest
 
-from solutions.common.ordered_list import OrderedList
+from solutions.common.burrow_layout import EMPTY, FOLDED_ROWS, Layout
+from solutions.common.search import SearchResult, a_star
 
 
 def digest_input(input_lines: list[str]) -> list[tuple["Pod", "Position"]]:
@@ -27,36 +28,41 @@ def part_one(pod_positions: list[tuple["Pod", "Position"]]) -> int:
 
 
 def part_two(pod_positions: list[tuple["Pod", "Position"]]) -> int:
-    puzzle = Puzzle(pod_positions, room_size=4)
+    puzzle = Puzzle(unfold(pod_positions), room_size=2 + len(FOLDED_ROWS))
     return a_star_puzzle(puzzle)
 
 
+def unfold(
+    pod_positions: list[tuple["Pod", "Position"]], rows: list[str] = FOLDED_ROWS
+) -> list[tuple["Pod", "Position"]]:
+    """
+    Adds the pods of `rows` below the top row. The bottom row's slot is -1, so it
+    stays at the bottom of the deeper rooms.
+    """
+    return pod_positions + [
+        (Pod(f), Position(i, slot))
+        for slot, row in enumerate(rows, start=1)
+        for i, f in enumerate(row)
+    ]
+
+
 def a_star_puzzle(puzzle: "Puzzle") -> int:
-    visited: dict[str, int] = {}
-    frontier: OrderedList[tuple[Puzzle, int]] = OrderedList(
-        [(puzzle, 0)], lambda i: heuristic(i[0]) + i[1]
-    )
-    solution: Optional[tuple[Puzzle, int]] = None
-    while solution is None and frontier:
-        candidate, cost = frontier.pop(0)
-        if candidate.is_solved():
-            solution = candidate, cost
-            break
-        candidate_hash = "".join(
-            "".join(map(str, room)) for room in candidate.rooms
-        ) + "".join(map(str, candidate.hallway))
-        if candidate_hash in visited and cost >= visited[candidate_hash]:
-            continue
-        visited[candidate_hash] = cost
-        moves = candidate.legal_moves()
-        for move in moves:
-            new_puzzle = candidate.copy()
-            cost_delta = new_puzzle.execute_move(move)
-            frontier.insert((new_puzzle, cost + cost_delta))
-    if solution is not None:
-        return solution[1]
-    else:
-        raise StopIteration()
+    return search_puzzle(puzzle).cost
+
+
+def search_puzzle(puzzle: "Puzzle") -> SearchResult:
+    """
+    States are packed into ints by the `Layout` for this shape of burrow, which
+    also works out the moves and heuristic. The result also tells how many states
+    were expanded and how large the frontier grew.
+    """
+    layout = standard_layout(puzzle.room_size)
+    goal = Puzzle.solved(puzzle.room_size).pack()
+    return a_star(puzzle.pack(), goal, layout.moves, layout.heuristic)
+
+
+def standard_layout(room_size: int) -> Layout:
+    return Layout.for_burrow(Puzzle.HALL_SIZE, tuple(Puzzle.ROOM_EXITS), room_size)
 
 
 class Puzzle:
@@ -71,6 +77,7 @@ class Puzzle:
     ROOM_FLAVORS = ["A", "B", "C", "D"]
     ROOM_EXITS = [2, 4, 6, 8]
     HALL_INDEX = 4
+    HALL_SIZE = 11
 
     def __init__(
         self, pod_inits: list[tuple["Pod", "Position"]], room_size: int = 2
@@ -85,11 +92,21 @@ class Puzzle:
         self.hallway: list[Optional[Pod]] = [None] * 11  # Eleven spots in the hallway
         for pod, position in pod_inits:
             self.get_room(position.room_index)[position.slot] = pod
-        if self.room_size == 4:
-            self.rooms[0][1:3] = [Pod("D"), Pod("D")]
-            self.rooms[1][1:3] = [Pod("C"), Pod("B")]
-            self.rooms[2][1:3] = [Pod("B"), Pod("A")]
-            self.rooms[3][1:3] = [Pod("A"), Pod("C")]
+
+    @classmethod
+    def solved(cls, room_size: int = 2) -> "Puzzle":
+        puzzle = cls([], room_size)
+        puzzle.rooms = [[Pod(flavor)] * room_size for flavor in cls.ROOM_FLAVORS]
+        return puzzle
+
+    def pack(self) -> int:
+        """The whole state as one int, packed by `Layout` for the search."""
+
+        def render(cells: list[Optional[Pod]]) -> str:
+            return "".join(EMPTY if pod is None else pod.flavor for pod in cells)
+
+        layout = standard_layout(self.room_size)
+        return layout.pack(render(self.hallway), [render(r) for r in self.rooms])
 
     def is_solved(self) -> bool:
         return all(
@@ -98,121 +115,6 @@ class Puzzle:
             for p in self.rooms[i]
         )
 
-    def copy(self) -> "Puzzle":
-        new_puzzle = Puzzle([])
-        new_puzzle.rooms = [
-            [p if p is None else p.copy() for p in room] for room in self.rooms
-        ]
-        new_puzzle.hallway = [p if p is None else p.copy() for p in self.hallway]
-        new_puzzle.room_size = self.room_size
-        return new_puzzle
-
-    def legal_moves(self) -> list["Move"]:
-        moves: list[Move] = []
-        for room_number in self.unsolved_rooms():
-            room = self.rooms[room_number]
-            room_exit = self.ROOM_EXITS[room_number]
-            pod_index = self.room_size - sum(p is not None for p in room)
-            if pod_index != self.room_size and self.hallway[room_exit] is None:
-                start = Position(room_number, pod_index)
-                pod = room[pod_index]
-                if pod is None:
-                    raise TypeError()
-                solution_room_number = self.ROOM_FLAVORS.index(pod.flavor)
-                solution_exit = self.ROOM_EXITS[solution_room_number]
-                solution_open = all(
-                    occupant is None or occupant.flavor == pod.flavor
-                    for occupant in self.rooms[solution_room_number]
-                )
-
-                left = room_exit
-                while left > 0 and self.hallway[left - 1] is None:
-                    left -= 1
-                if solution_open and left <= solution_exit < room_exit:
-                    solution_room_slot = (
-                        self.room_size
-                        - 1
-                        - sum(p is not None for p in self.rooms[solution_room_number])
-                    )
-                    left_ends = [Position(solution_room_number, solution_room_slot)]
-                else:
-                    left_ends = [
-                        Position(self.HALL_INDEX, p) for p in range(left, room_exit)
-                    ]
-                for left_end in left_ends:
-                    moves.append(Move(start, left_end))
-
-                right = room_exit
-                while right < 10 and self.hallway[right + 1] is None:
-                    right += 1
-                if solution_open and right >= solution_exit > room_exit:
-                    solution_room_slot = (
-                        self.room_size
-                        - 1
-                        - sum(p is not None for p in self.rooms[solution_room_number])
-                    )
-                    right_ends = [Position(solution_room_number, solution_room_slot)]
-                else:
-                    right_ends = [
-                        Position(self.HALL_INDEX, p)
-                        for p in range(room_exit + 1, right + 1)
-                    ]
-                for right_end in right_ends:
-                    moves.append(Move(start, right_end))
-
-        for hall_index, pod in enumerate(self.hallway):
-            if pod is None:
-                continue
-            solution_room_number = self.ROOM_FLAVORS.index(pod.flavor)
-            solution_open = all(
-                occupant is None or occupant.flavor == pod.flavor
-                for occupant in self.rooms[solution_room_number]
-            )
-            if not solution_open:
-                continue
-            solution_exit = self.ROOM_EXITS[solution_room_number]
-            if solution_exit <= hall_index:
-                path_clear = all(
-                    self.hallway[i] is None for i in range(solution_exit, hall_index)
-                )
-            else:
-                path_clear = all(
-                    self.hallway[i] is None
-                    for i in range(hall_index + 1, solution_exit + 1)
-                )
-            if path_clear:
-                start = Position(4, hall_index)
-                slots_filled = sum(
-                    p is not None for p in self.rooms[solution_room_number]
-                )
-                solution_room_slot = self.room_size - 1 - slots_filled
-                end = Position(solution_room_number, solution_room_slot)
-                moves.append(Move(start, end))
-
-        return moves
-
-    def unsolved_rooms(self) -> list[int]:
-        room_numbers: list[int] = []
-        for number, flavor in enumerate("ABCD"):
-            in_stack = False
-            for slot, pod in enumerate(self.rooms[number]):
-                if not in_stack and pod is not None:
-                    in_stack = True
-                if in_stack:
-                    if pod is None or pod.flavor != flavor:
-                        room_numbers.append(number)
-                        break
-        return room_numbers
-
-    def execute_move(self, move: "Move") -> int:
-        """Mutates self and returns the cost of the move"""
-        pod = self.get_room(move.start.room_index)[move.start.slot]
-        if pod is None:
-            raise ValueError()
-        self.get_room(move.start.room_index)[move.start.slot] = None
-        self.get_room(move.end.room_index)[move.end.slot] = pod
-        return pod.move_cost * self.distance(move)
-
     @classmethod
     def distance(cls, move: "Move") -> int:
         steps = 0
@@ -236,18 +138,6 @@ class Puzzle:
             return self.rooms[room_index]
 
 
-def heuristic(puzzle: "Puzzle") -> int:
-    total = 0
-    for room_number, room in enumerate(puzzle.rooms):
-        for slot, pod in enumerate(room):
-            if pod is None:
-                continue
-            solution_room_number = puzzle.ROOM_FLAVORS.index(pod.flavor)
-            hall_distance = abs(room_number - solution_room_number + slot) * 2
-            total += (hall_distance + slot + 2) * pod.move_cost
-    return total
-
-
 @dataclass
 class Move:
     start: "Position"
@@ -279,30 +169,174 @@ class Pod:
         return Pod(self.flavor)
 
 
+# Pod by pod moves, an oracle for the packed moves of `Layout` in the tests below
+
+
+def packed_move(puzzle: Puzzle, state: int, move: Move) -> tuple[int, int]:
+    """Returns the packed state after the move, and the cost of the move."""
+    layout = standard_layout(puzzle.room_size)
+    start = layout.cell_bits * cell(puzzle, move.start)
+    end = layout.cell_bits * cell(puzzle, move.end)
+    code = state >> start & layout.cell_mask
+    new_state = state & ~(layout.cell_mask << start) | code << end
+    return new_state, layout.costs[code] * Puzzle.distance(move)
+
+
+def cell(puzzle: Puzzle, position: Position) -> int:
+    """Cells are numbered along the hallway, then down each room in turn."""
+    if position.room_index == Puzzle.HALL_INDEX:
+        return position.slot
+    slot = position.slot % puzzle.room_size
+    return Puzzle.HALL_SIZE + position.room_index * puzzle.room_size + slot
+
+
+def copy_puzzle(puzzle: Puzzle) -> Puzzle:
+    new_puzzle = Puzzle([])
+    new_puzzle.rooms = [
+        [p if p is None else p.copy() for p in room] for room in puzzle.rooms
+    ]
+    new_puzzle.hallway = [p if p is None else p.copy() for p in puzzle.hallway]
+    new_puzzle.room_size = puzzle.room_size
+    return new_puzzle
+
+
+def legal_moves(puzzle: Puzzle) -> list[Move]:
+    moves: list[Move] = []
+    for room_number in unsolved_rooms(puzzle):
+        room = puzzle.rooms[room_number]
+        room_exit = Puzzle.ROOM_EXITS[room_number]
+        pod_index = puzzle.room_size - sum(p is not None for p in room)
+        if pod_index != puzzle.room_size and puzzle.hallway[room_exit] is None:
+            start = Position(room_number, pod_index)
+            pod = room[pod_index]
+            if pod is None:
+                raise TypeError()
+            solution_room_number = Puzzle.ROOM_FLAVORS.index(pod.flavor)
+            solution_exit = Puzzle.ROOM_EXITS[solution_room_number]
+            solution_open = all(
+                occupant is None or occupant.flavor == pod.flavor
+                for occupant in puzzle.rooms[solution_room_number]
+            )
+
+            left = room_exit
+            while left > 0 and puzzle.hallway[left - 1] is None:
+                left -= 1
+            if solution_open and left <= solution_exit < room_exit:
+                solution_room_slot = (
+                    puzzle.room_size
+                    - 1
+                    - sum(p is not None for p in puzzle.rooms[solution_room_number])
+                )
+                left_ends = [Position(solution_room_number, solution_room_slot)]
+            else:
+                left_ends = [
+                    Position(Puzzle.HALL_INDEX, p)
+                    for p in range(left, room_exit)
+                    if p not in Puzzle.ROOM_EXITS
+                ]
+            for left_end in left_ends:
+                moves.append(Move(start, left_end))
+
+            right = room_exit
+            while right < 10 and puzzle.hallway[right + 1] is None:
+                right += 1
+            if solution_open and right >= solution_exit > room_exit:
+                solution_room_slot = (
+                    puzzle.room_size
+                    - 1
+                    - sum(p is not None for p in puzzle.rooms[solution_room_number])
+                )
+                right_ends = [Position(solution_room_number, solution_room_slot)]
+            else:
+                right_ends = [
+                    Position(Puzzle.HALL_INDEX, p)
+                    for p in range(room_exit + 1, right + 1)
+                    if p not in Puzzle.ROOM_EXITS
+                ]
+            for right_end in right_ends:
+                moves.append(Move(start, right_end))
+
+    for hall_index, pod in enumerate(puzzle.hallway):
+        if pod is None:
+            continue
+        solution_room_number = Puzzle.ROOM_FLAVORS.index(pod.flavor)
+        solution_open = all(
+            occupant is None or occupant.flavor == pod.flavor
+            for occupant in puzzle.rooms[solution_room_number]
+        )
+        if not solution_open:
+            continue
+        solution_exit = Puzzle.ROOM_EXITS[solution_room_number]
+        if solution_exit <= hall_index:
+            path_clear = all(
+                puzzle.hallway[i] is None for i in range(solution_exit, hall_index)
+            )
+        else:
+            path_clear = all(
+                puzzle.hallway[i] is None
+                for i in range(hall_index + 1, solution_exit + 1)
+            )
+        if path_clear:
+            start = Position(4, hall_index)
+            slots_filled = sum(
+                p is not None for p in puzzle.rooms[solution_room_number]
+            )
+            solution_room_slot = puzzle.room_size - 1 - slots_filled
+            end = Position(solution_room_number, solution_room_slot)
+            moves.append(Move(start, end))
+
+    return moves
+
+
+def unsolved_rooms(puzzle: Puzzle) -> list[int]:
+    room_numbers: list[int] = []
+    for number, flavor in enumerate("ABCD"):
+        in_stack = False
+        for slot, pod in enumerate(puzzle.rooms[number]):
+            if not in_stack and pod is not None:
+                in_stack = True
+            if in_stack:
+                if pod is None or pod.flavor != flavor:
+                    room_numbers.append(number)
+                    break
+    return room_numbers
+
+
+def execute_move(puzzle: Puzzle, move: Move) -> int:
+    """Mutates the puzzle and returns the cost of the move"""
+    pod = puzzle.get_room(move.start.room_index)[move.start.slot]
+    if pod is None:
+        raise ValueError()
+    puzzle.get_room(move.start.room_index)[move.start.slot] = None
+    puzzle.get_room(move.end.room_index)[move.end.slot] = pod
+    return pod.move_cost * Puzzle.distance(move)
+
+
 def test_legal_moves_one_solvable_pawn():
     puzzle = Puzzle([(Pod("A"), Position(1, 1))])
-    moves = puzzle.legal_moves()
-    assert len(moves) == 7
+    moves = legal_moves(puzzle)
+    assert len(moves) == 5
 
 
 def test_legal_moves_stacked_pawns_unsolvable():
     puzzle = Puzzle([(Pod("A"), Position(0, 0)), (Pod("B"), Position(0, 1))])
-    moves = puzzle.legal_moves()
-    assert len(moves) == 10
+    moves = legal_moves(puzzle)
+    assert len(moves) == 7
     assert all(move.start == Position(0, 0) for move in moves)
+    assert all(move.end.slot not in Puzzle.ROOM_EXITS for move in moves)
 
 
 def test_legal_moves_separate_pawns_unsolvable():
     puzzle = Puzzle([(Pod("A"), Position(1, 1)), (Pod("B"), Position(0, 1))])
-    moves = puzzle.legal_moves()
-    assert len(moves) == 20
+    moves = legal_moves(puzzle)
+    assert len(moves) == 14
     assert all(move.start in (Position(0, 1), Position(1, 1)) for move in moves)
     assert all(move.end.room_index == Puzzle.HALL_INDEX for move in moves)
 
 
 def test_legal_moves_hallway():
     puzzle = Puzzle([(Pod("A"), Position(4, 0))])
-    moves = puzzle.legal_moves()
+    moves = legal_moves(puzzle)
     assert len(moves) == 1
     assert moves[0].start == Position(4, 0)
     assert moves[0].end == Position(0, 1)
@@ -354,6 +388,66 @@ def test_example_last():
     assert a_star_puzzle(puzzle) == 8
 
 
+def puzzles(room_size: int) -> Iterator[tuple[Puzzle, int]]:
+    """Random walks of legal moves from the example, unfolded to `room_size`"""
+    example = [
+        "#############",
+        "#...........#",
+        "###B#C#B#D###",
+        "  #A#D#C#A#",
+        "  #########",
+    ]
+    pod_positions = unfold(digest_input(example), FOLDED_ROWS[: room_size - 2])
+    generator = random.Random(room_size)
+    for _ in range(20):
+        puzzle = Puzzle(pod_positions, room_size=room_size)
+        while True:
+            yield puzzle, puzzle.pack()
+            moves = legal_moves(puzzle)
+            if not moves:
+                break
+            execute_move(puzzle, generator.choice(moves))
+
+
+@pytest.mark.parametrize("room_size", [2, 3, 4])
+def test_packing(room_size):
+    puzzle, _ = next(puzzles(room_size))
+    puzzle.hallway[5] = Pod("D")
+    state = puzzle.pack()
+    for move in legal_moves(puzzle):
+        moved = copy_puzzle(puzzle)
+        cost = execute_move(moved, move)
+        assert packed_move(puzzle, state, move) == (moved.pack(), cost)
+
+
+@pytest.mark.parametrize("room_size", [2, 3, 4])
+def test_layout_legal_moves_match_legal_moves(room_size):
+    layout = standard_layout(room_size)
+    for puzzle, state in puzzles(room_size):
+        expected = [packed_move(puzzle, state, move) for move in legal_moves(puzzle)]
+        assert layout.legal_moves(state) == expected
+        # Consistent: no move lowers the estimate by more than it costs
+        estimate = layout.heuristic(state)
+        assert all(estimate <= cost + layout.heuristic(s) for s, cost in expected)
+
+
+@pytest.mark.parametrize("room_size", [2, 3, 4])
+def test_layout_moves_keep_one_move_home(room_size):
+    layout = standard_layout(room_size)
+    for puzzle, state in puzzles(room_size):
+        moves = legal_moves(puzzle)
+        homes = [
+            packed_move(puzzle, state, move)
+            for move in moves
+            if move.end.room_index != Puzzle.HALL_INDEX
+        ]
+        found = layout.moves(state)
+        if homes:
+            assert len(found) == 1 and found[0] in homes
+        else:
+            assert found == [packed_move(puzzle, state, move) for move in moves]
+
+
 def test_example():
     example = [
         "#############",
@@ -363,6 +457,12 @@ def test_example():
         "  #########",
     ]
     assert part_one(digest_input(example)) == 12521
+    puzzle = Puzzle(digest_input(example))
+    result = search_puzzle(puzzle)
+    assert result.cost == 12521 and result.expanded and result.peak_frontier
+    layout = standard_layout(2)
+    assert layout.heuristic(Puzzle.solved(2).pack()) == 0
+    assert layout.heuristic(puzzle.pack()) <= 12521
 
 
 def test_part_two_example():
@@ -380,8 +480,6 @@ def test_legal_moves_hall_to_solve_four_size():
     puzzle = Puzzle(
         [(Pod("A"), Position(0, 3)), (Pod("A"), Position(4, 0))], room_size=4
     )
-    for room in puzzle.rooms:
-        room[1:3] = [None, None]
-    moves = puzzle.legal_moves()
+    moves = legal_moves(puzzle)
     assert len(moves) == 1
     assert moves[0].end.slot == 2
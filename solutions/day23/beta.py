@@ -0,0 +1,90 @@
+from typing import NamedTuple
+
+import pytest
+
+from solutions.common.burrow_layout import EMPTY, FOLDED_ROWS, Layout, flavor
+from solutions.common.search import SearchResult, a_star
+
+
+IMMUTABLE_DIGEST = True
+
+EXAMPLE = [
+    "#############",
+    "#...........#",
+    "###B#C#B#D###",
+    "  #A#D#C#A#",
+    "  #########",
+]
+
+
+class Burrow(NamedTuple):
+    """
+    A diagram of any hallway length, room count and room depth. Room `i` belongs
+    to the `i`th letter of the alphabet, whose pods cost `10**i` per step.
+
+    `hallway` holds a pod letter or EMPTY per hallway cell, `exits` the hallway
+    cell above each room, and `rooms` each room's contents from the top down.
+    """
+
+    hallway: str
+    exits: tuple[int, ...]
+    rooms: tuple[str, ...]
+
+    @classmethod
+    def from_diagram(cls, lines: list[str]) -> "Burrow":
+        hallway = lines[1].strip()[1:-1]
+        columns = [x for x, c in enumerate(lines[2]) if c not in "# "]
+        rows = [line for line in lines[2:] if line.strip(" #")]
+        rooms = tuple("".join(row[x] for row in rows) for x in columns)
+        offset = lines[1].index("#") + 1
+        return cls(hallway, tuple(x - offset for x in columns), rooms)
+
+    def unfolded(self) -> "Burrow":
+        if len(self.rooms) != len(FOLDED_ROWS[0]):
+            raise ValueError("Only a burrow of four rooms can be unfolded")
+        rooms = tuple(
+            room[0] + "".join(row[i] for row in FOLDED_ROWS) + room[1:]
+            for i, room in enumerate(self.rooms)
+        )
+        return self._replace(rooms=rooms)
+
+    def search(self) -> SearchResult:
+        layout = Layout.for_burrow(len(self.hallway), self.exits, len(self.rooms[0]))
+        goal = layout.pack(
+            EMPTY * len(self.hallway),
+            [flavor(i) * layout.depth for i in range(len(self.rooms))],
+        )
+        start = layout.pack(self.hallway, self.rooms)
+        return a_star(start, goal, layout.moves, layout.heuristic)
+
+
+def digest_input(input_lines: list[str]) -> Burrow:
+    return Burrow.from_diagram(input_lines)
+
+
+def part_one(burrow: Burrow) -> int:
+    return burrow.search().cost
+
+
+def part_two(burrow: Burrow) -> int:
+    return burrow.unfolded().search().cost
+
+
+def test_digest_input():
+    burrow = digest_input(EXAMPLE)
+    assert burrow == Burrow(EMPTY * 11, (2, 4, 6, 8), ("BA", "CD", "BC", "DA"))
+    assert burrow.unfolded().rooms == ("BDDA", "CCBD", "BBAC", "DACA")
+    with pytest.raises(ValueError):
+        digest_input(["#####", "#...#", "##A##", " ### "]).unfolded()
+
+
+def test_small_burrows():
+    assert part_one(digest_input(["#######", "#.....#", "##B#A##", " ##### "])) == 46
+    blocked = ["#######", "#..B..#", "##.#A##", " #A#B# ", " ##### "]
+    # The A has to make way for the B, then walks around it
+    assert part_one(digest_input(blocked)) == 2 + 20 + 4
+
+
+def test_example():
+    assert part_one(digest_input(EXAMPLE)) == 12521
+    assert part_two(digest_input(EXAMPLE)) == 44169
@@ -0,0 +1,218 @@
+from dataclasses import asdict, dataclass
+import json
+import os
+import subprocess
+import time
+from typing import Iterable, Optional
+
+from solutions.benchmark import PartBenchmark, format_milliseconds
+
+
+REPOSITORY_DIRECTORY = os.path.dirname(__file__) + "/.."
+DEFAULT_HISTORY_PATH = os.path.join(REPOSITORY_DIRECTORY, "benchmark_history.jsonl")
+
+
+@dataclass
+class HistoryRecord:
+    """One benchmarked part at one commit. Times are medians in nanoseconds."""
+
+    commit: str
+    dirty: bool
+    timestamp: float
+    day: int
+    implementation: str
+    part: str
+    repeats: int
+    digest_median: float
+    solve_median: float
+    total_median: float
+
+    @property
+    def key(self) -> tuple[int, str, str]:
+        return (self.day, self.implementation, self.part)
+
+
+@dataclass
+class Regression:
+    baseline: HistoryRecord
+    current: HistoryRecord
+
+    @property
+    def ratio(self) -> float:
+        return self.current.total_median / self.baseline.total_median
+
+
+def current_commit() -> tuple[str, bool]:
+    """Returns the HEAD commit hash and whether the working tree has changes."""
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=REPOSITORY_DIRECTORY,
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout.strip()
+        status = subprocess.run(
+            ["git", "status", "--porcelain", "--untracked-files=no"],
+            cwd=REPOSITORY_DIRECTORY,
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown", True
+    return commit, bool(status.strip())
+
+
+def make_records(
+    day: int,
+    implementation: str,
+    benchmarks: list[PartBenchmark],
+    repeats: int,
+    commit: str,
+    dirty: bool,
+) -> list[HistoryRecord]:
+    timestamp = time.time()
+    return [
+        HistoryRecord(
+            commit,
+            dirty,
+            timestamp,
+            day,
+            implementation,
+            benchmark.part_name,
+            repeats,
+            benchmark.digest.median,
+            benchmark.solve.median,
+            benchmark.total.median,
+        )
+        for benchmark in benchmarks
+    ]
+
+
+def read_history(path: str = DEFAULT_HISTORY_PATH) -> list[HistoryRecord]:
+    if not os.path.exists(path):
+        return []
+    with open(path) as history_file:
+        return [
+            HistoryRecord(**json.loads(line)) for line in history_file if line.strip()
+        ]
+
+
+def append_history(
+    records: Iterable[HistoryRecord], path: str = DEFAULT_HISTORY_PATH
+) -> None:
+    with open(path, "a") as history_file:
+        for record in records:
+            history_file.write(json.dumps(asdict(record)) + "\n")
+
+
+def select_baseline(
+    history: list[HistoryRecord], current: str, baseline: Optional[str] = None
+) -> dict[tuple[int, str, str], HistoryRecord]:
+    """
+    Picks one baseline commit, the most recently recorded one other than `current`
+    unless `baseline` (which may be abbreviated) names it, and returns its most
+    recent record for each (day, implementation, part).
+    """
+    if baseline is not None:
+        commits = [r.commit for r in history if r.commit.startswith(baseline)]
+    else:
+        commits = [r.commit for r in history if r.commit != current]
+    if not commits:
+        return {}
+    return {record.key: record for record in history if record.commit == commits[-1]}
+
+
+def find_regressions(
+    records: list[HistoryRecord],
+    baseline: dict[tuple[int, str, str], HistoryRecord],
+    threshold: float,
+) -> list[Regression]:
+    """A part regresses when its median runtime grows by more than `threshold`."""
+    regressions: list[Regression] = []
+    for record in records:
+        base_record = baseline.get(record.key)
+        if base_record is None or base_record.total_median <= 0:
+            continue
+        if record.total_median > base_record.total_median * (1 + threshold):
+            regressions.append(Regression(base_record, record))
+    return regressions
+
+
+def print_comparison(
+    records: list[HistoryRecord],
+    baseline: dict[tuple[int, str, str], HistoryRecord],
+    regressions: list[Regression],
+) -> None:
+    regressed = {regression.current.key for regression in regressions}
+    for record in records:
+        base_record = baseline.get(record.key)
+        label = f"Day {record.day} {record.implementation} {record.part}"
+        current_ms = format_milliseconds(record.total_median)
+        if base_record is None:
+            print(f"{label}: {current_ms} ms (no baseline)")
+            continue
+        base_ms = format_milliseconds(base_record.total_median)
+        flag = "  REGRESSION" if record.key in regressed else ""
+        print(
+            f"{label}: {current_ms} ms vs {base_ms} ms "
+            f"at {base_record.commit[:8]}{flag}"
+        )
+
+
+def make_record(commit: str, part: str, total_median: float) -> HistoryRecord:
+    return HistoryRecord(commit, False, 0.0, 1, "alpha", part, 5, 0, 0, total_median)
+
+
+def test_history_round_trip(tmp_path):
+    path = str(tmp_path / "history.jsonl")
+    records = [make_record("abc", "part_one", 10), make_record("abc", "part_two", 20)]
+    append_history(records, path)
+    append_history(records[:1], path)
+    assert read_history(path) == records + records[:1]
+
+
+def test_read_history_skips_blank_lines(tmp_path):
+    path = tmp_path / "history.jsonl"
+    append_history([make_record("abc", "part_one", 10)], str(path))
+    with open(path, "a") as history_file:
+        history_file.write("  \n\n")
+    assert read_history(str(path)) == [make_record("abc", "part_one", 10)]
+
+
+def test_select_baseline_skips_current_commit():
+    history = [
+        make_record("old", "part_one", 10),
+        make_record("older", "part_two", 30),
+        make_record("new", "part_one", 20),
+        make_record("head", "part_one", 50),
+    ]
+    baseline = select_baseline(history, "head")
+    assert baseline == {(1, "alpha", "part_one"): history[2]}
+    assert select_baseline(history, "head", "olde") == {
+        (1, "alpha", "part_two"): history[1]
+    }
+    assert select_baseline(history, "head", "missing") == {}
+
+
+def test_select_baseline_uses_one_commit():
+    history = [
+        make_record("old", "part_one", 10),
+        make_record("old", "part_two", 30),
+        make_record("new", "part_one", 20),
+        make_record("new", "part_one", 25),
+    ]
+    baseline = select_baseline(history, "head")
+    assert baseline == {(1, "alpha", "part_one"): history[3]}
+
+
+def test_find_regressions():
+    baseline = {
+        (1, "alpha", "part_one"): make_record("old", "part_one", 100),
+        (1, "alpha", "part_two"): make_record("old", "part_two", 100),
+    }
+    records = [make_record("new", "part_one", 109), make_record("new", "part_two", 111)]
+    regressions = find_regressions(records, baseline, 0.1)
+    assert [r.current.part for r in regressions] == ["part_two"]
+    assert regressions[0].ratio == 1.11
@@ -0,0 +1,178 @@
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+import multiprocessing
+from multiprocessing.connection import Connection
+import os
+import resource
+import time
+from typing import Callable, Optional
+
+from solutions.runner import (
+    PART_NAMES,
+    DayResult,
+    PartResult,
+    PartStatus,
+    describe_error,
+    run_day_part,
+)
+
+
+BYTES_PER_MIB = 2**20
+# Children are started from worker threads, and forking a threaded process can
+# copy a lock some other thread holds, so they come from a fork server instead
+CONTEXT = multiprocessing.get_context("forkserver")
+
+PartRunner = Callable[[int, str, str], PartResult]
+
+
+@dataclass(frozen=True)
+class Limits:
+    """`timeout` is in seconds and `max_memory` is an address space cap in bytes."""
+
+    timeout: Optional[float] = None
+    max_memory: Optional[int] = None
+
+
+class PartFailure(Exception):
+    """An exception raised inside a limited part's child process, as described there."""
+
+
+def _limited_part_worker(
+    connection: Connection,
+    day: int,
+    implementation: str,
+    part_name: str,
+    max_memory: Optional[int],
+    part_runner: PartRunner,
+) -> None:
+    if max_memory is not None:
+        resource.setrlimit(resource.RLIMIT_AS, (max_memory, max_memory))
+    try:
+        connection.send((PartStatus.OK, part_runner(day, implementation, part_name)))
+    except MemoryError:
+        connection.send((PartStatus.OOM, None))
+    except Exception as error:
+        connection.send((None, describe_error(error)))
+    finally:
+        connection.close()
+
+
+def run_limited_part(
+    day: int,
+    implementation: str,
+    part_name: str,
+    limits: Limits,
+    part_runner: PartRunner = run_day_part,
+) -> PartResult:
+    """
+    Runs one part in a child process capped by `limits`. A child that is still
+    running at the timeout is killed and reported as TIMEOUT; one that runs out of
+    memory, or dies without reporting back while under a memory cap, as OOM.
+    `part_runner` is looked up by name in the child, so it has to be a module-level
+    function.
+    """
+    receiver, sender = CONTEXT.Pipe(duplex=False)
+    process = CONTEXT.Process(
+        target=_limited_part_worker,
+        args=(sender, day, implementation, part_name, limits.max_memory, part_runner),
+    )
+    start = time.perf_counter()
+    process.start()
+    sender.close()
+    try:
+        if not receiver.poll(limits.timeout):
+            process.kill()
+            elapsed = time.perf_counter() - start
+            return PartResult(None, 0.0, elapsed, status=PartStatus.TIMEOUT)
+        try:
+            status, payload = receiver.recv()
+        except EOFError:
+            if limits.max_memory is None:
+                raise PartFailure(f"{part_name} worker died unexpectedly")
+            status, payload = PartStatus.OOM, None
+    finally:
+        process.join()
+        receiver.close()
+    if status is PartStatus.OK:
+        return payload
+    if status is PartStatus.OOM:
+        elapsed = time.perf_counter() - start
+        return PartResult(None, 0.0, elapsed, status=PartStatus.OOM)
+    raise PartFailure(payload)
+
+
+def run_limited_day(
+    day: int, implementation: str, limits: Limits, parallel_parts: bool = False
+) -> DayResult:
+    try:
+        if parallel_parts:
+            with ThreadPoolExecutor(max_workers=len(PART_NAMES)) as executor:
+                futures = [
+                    executor.submit(
+                        run_limited_part, day, implementation, part_name, limits
+                    )
+                    for part_name in PART_NAMES
+                ]
+                parts = tuple(future.result() for future in futures)
+        else:
+            parts = tuple(
+                run_limited_part(day, implementation, part_name, limits)
+                for part_name in PART_NAMES
+            )
+    except PartFailure as failure:
+        return DayResult(day, implementation, error=str(failure))
+    except Exception as error:
+        return DayResult(day, implementation, error=describe_error(error))
+    return DayResult(day, implementation, parts)
+
+
+def run_limited_days(
+    days: list[int],
+    implementation: str,
+    limits: Limits,
+    workers: Optional[int] = None,
+    parallel_parts: bool = False,
+) -> list[DayResult]:
+    """
+    Like `run_days`, but every part runs in its own capped child process. The
+    threads here only wait on those children.
+    """
+    with ThreadPoolExecutor(max_workers=workers or os.cpu_count()) as executor:
+        futures = [
+            executor.submit(
+                run_limited_day, day, implementation, limits, parallel_parts
+            )
+            for day in days
+        ]
+        return [future.result() for future in futures]
+
+
+def _sleeping_part(*args):
+    time.sleep(5)
+
+
+def _hungry_part(*args):
+    return bytearray(512 * BYTES_PER_MIB)
+
+
+def test_limits_timeout():
+    limits = Limits(timeout=0.5)
+    result = run_limited_part(1, "alpha", "part_one", limits, _sleeping_part)
+    assert result.status is PartStatus.TIMEOUT
+
+
+def test_limits_oom():
+    limits = Limits(max_memory=256 * BYTES_PER_MIB)
+    result = run_limited_part(1, "alpha", "part_one", limits, _hungry_part)
+    assert result.status is PartStatus.OOM
+
+
+def test_limits_parallel_parts():
+    result = run_limited_day(1, "alpha", Limits(timeout=30), parallel_parts=True)
+    assert result.error is None
+    assert all(part.status is PartStatus.OK for part in result.parts)
+
+
+def test_limits_error_captured():
+    result = run_limited_day(1, "nonexistent", Limits(timeout=10))
+    assert result.error is not None and result.error.startswith("ModuleNotFoundError")
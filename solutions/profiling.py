@@ -0,0 +1,140 @@
+from concurrent.futures import ProcessPoolExecutor
+import cProfile
+from dataclasses import dataclass
+import io
+import os
+import pstats
+import resource
+import sys
+import tracemalloc
+from typing import Any, Optional
+
+from solutions.common.input_reader import get_input_lines
+from solutions.runner import HLINE_SIZE, PART_NAMES, format_solution, load_module
+
+
+TOP_FUNCTIONS = 20
+TOP_ALLOCATIONS = 10
+
+
+@dataclass
+class ProfileReport:
+    part_name: str
+    solution: Any
+    peak_rss_kib: int
+    hotspots: Optional[str] = None
+    profile_path: Optional[str] = None
+    allocations: Optional[str] = None
+    traced_peak_bytes: Optional[int] = None
+
+
+def peak_rss_kib() -> int:
+    """ru_maxrss is reported in bytes on macOS and in KiB elsewhere."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+def profile_part(
+    day: int,
+    implementation: str,
+    part_name: str,
+    cpu: bool,
+    memory: bool,
+    profile_directory: str = ".",
+) -> ProfileReport:
+    """
+    Digests the input and solves one part under cProfile and/or tracemalloc. This
+    is meant to run in a fresh process so that the peak RSS belongs to this part.
+    """
+    solution_module = load_module(day, implementation)
+    input_lines = get_input_lines(day)
+    digester = getattr(solution_module, "digest_input", lambda x: x)
+    solver = getattr(solution_module, part_name, lambda x: "(solution pending)")
+    profiler = cProfile.Profile() if cpu else None
+    if memory:
+        tracemalloc.start()
+    if profiler is not None:
+        profiler.enable()
+    digested_lines = digester(input_lines)
+    solution = solver(digested_lines)
+    if profiler is not None:
+        profiler.disable()
+    report = ProfileReport(part_name, solution, peak_rss_kib())
+    if memory:
+        snapshot = tracemalloc.take_snapshot().filter_traces(
+            [tracemalloc.Filter(False, __file__)]
+        )
+        report.traced_peak_bytes = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        report.allocations = "\n".join(
+            str(statistic)
+            for statistic in snapshot.statistics("lineno")[:TOP_ALLOCATIONS]
+        )
+    if profiler is not None:
+        profile_name = f"day{str(day).zfill(2)}_{implementation}_{part_name}.prof"
+        report.profile_path = os.path.join(profile_directory, profile_name)
+        os.makedirs(profile_directory, exist_ok=True)
+        profiler.dump_stats(report.profile_path)
+        hotspots = io.StringIO()
+        stats = pstats.Stats(profiler, stream=hotspots)
+        stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(TOP_FUNCTIONS)
+        report.hotspots = hotspots.getvalue().strip()
+    return report
+
+
+def profile_day(
+    day: int,
+    implementation: str,
+    cpu: bool,
+    memory: bool,
+    profile_directory: str = ".",
+) -> list[ProfileReport]:
+    reports: list[ProfileReport] = []
+    for part_name in PART_NAMES:
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            future = executor.submit(
+                profile_part,
+                day,
+                implementation,
+                part_name,
+                cpu,
+                memory,
+                profile_directory,
+            )
+            reports.append(future.result())
+    return reports
+
+
+def print_profile_report(
+    day: int, implementation: str, reports: list[ProfileReport]
+) -> None:
+    print("=" * HLINE_SIZE)
+    print(f"Profiling day {day} ({implementation})")
+    for report in reports:
+        print("-" * HLINE_SIZE)
+        print(f"{report.part_name}: {format_solution(report.solution)}")
+        print(f"Peak RSS: {report.peak_rss_kib / 1024:.1f} MiB")
+        if report.traced_peak_bytes is not None:
+            traced_peak = report.traced_peak_bytes / 2**20
+            print(f"Peak traced allocations: {traced_peak:.3f} MiB")
+        if report.hotspots is not None:
+            print(f"Hotspots by cumulative time (saved to {report.profile_path}):")
+            print(report.hotspots)
+        if report.allocations is not None:
+            print("Largest allocation sites live at the end of the part:")
+            print(report.allocations)
+    print("=" * HLINE_SIZE)
+
+
+def test_peak_rss_kib():
+    ballast = bytearray(32 * 2**20)
+    assert peak_rss_kib() >= len(ballast) // 1024
+
+
+def test_profile_part_creates_profile_directory(tmp_path):
+    profile_directory = str(tmp_path / "nested")
+    report = profile_part(1, "alpha", "part_one", True, False, profile_directory)
+    assert report.profile_path is not None
+    assert os.path.dirname(report.profile_path) == profile_directory
+    assert os.path.exists(report.profile_path)
+    assert report.hotspots
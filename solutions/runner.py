@@ -0,0 +1,371 @@
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from enum import Enum
+from importlib import import_module
+import os
+import pkgutil
+import time
+from types import ModuleType
+from typing import Any, Iterable, Optional
+
+import pytest
+
+import solutions
+from solutions.common.input_reader import (
+    INPUTS_DIRECTORY_VARIABLE,
+    InputStream,
+    get_input_lines,
+)
+
+
+HLINE_SIZE = 60
+PART_NAMES = ("part_one", "part_two")
+
+
+class PartStatus(Enum):
+    OK = 0
+    TIMEOUT = 1
+    OOM = 2
+
+
+@dataclass
+class PartResult:
+    solution: Any
+    digest_time: float
+    solve_time: float
+    shared_digest: bool = False
+    status: PartStatus = PartStatus.OK
+
+    @property
+    def display_solution(self) -> str:
+        if self.status is not PartStatus.OK:
+            return self.status.name
+        return format_solution(self.solution)
+
+    @property
+    def runtime(self) -> float:
+        return self.digest_time + self.solve_time
+
+
+@dataclass
+class DayResult:
+    day: int
+    implementation: str
+    parts: tuple[PartResult, ...] = ()
+    error: Optional[str] = None
+
+    @property
+    def runtime(self) -> float:
+        return sum(part.runtime for part in self.parts)
+
+
+def available_days() -> list[int]:
+    return sorted(
+        int(module.name[3:])
+        for module in pkgutil.iter_modules(solutions.__path__)
+        if module.ispkg and module.name.startswith("day")
+    )
+
+
+def available_implementations(day: int) -> list[str]:
+    """Every solution module in a day's package, with alpha first."""
+    day_package = import_module(f"solutions.day{str(day).zfill(2)}")
+    names = [
+        module.name
+        for module in pkgutil.iter_modules(day_package.__path__)
+        if not module.ispkg and module.name != "conftest"
+    ]
+    return sorted(names, key=lambda name: (name != "alpha", name))
+
+
+def parse_days(day_spec: str) -> list[int]:
+    """
+    Accepts a single day ("5"), an inclusive range ("3-7"), a comma-separated
+    combination of the two ("1,3-5"), or "all".
+    """
+    if day_spec == "all":
+        return available_days()
+    days: set[int] = set()
+    for chunk in day_spec.split(","):
+        if "-" in chunk:
+            first, last = chunk.split("-", 1)
+            days.update(range(int(first), int(last) + 1))
+        else:
+            days.add(int(chunk))
+    return sorted(days)
+
+
+def load_module(day: int, implementation: str) -> ModuleType:
+    return import_module(f"solutions.day{str(day).zfill(2)}.{implementation}")
+
+
+def read_input(solution_module: ModuleType, day: int) -> Iterable[str]:
+    """
+    A module whose `digest_input` reads its input lines once, in order, can set
+    `STREAMING_DIGEST = True` to be fed them straight from the file instead of
+    from a list holding the whole input.
+    """
+    if getattr(solution_module, "STREAMING_DIGEST", False):
+        return InputStream(day)
+    return get_input_lines(day)
+
+
+def digest(
+    solution_module: ModuleType, input_lines: Iterable[str]
+) -> tuple[Any, float]:
+    """Returns the digested input and the time it took to digest."""
+    digester = getattr(solution_module, "digest_input", lambda x: x)
+    start = time.perf_counter()
+    # Lists are copied since digesters may consume them; streams re-read the file
+    if isinstance(input_lines, list):
+        input_lines = input_lines[:]
+    digested_lines = digester(input_lines)
+    return digested_lines, time.perf_counter() - start
+
+
+def solve(
+    solution_module: ModuleType, part_name: str, digested_lines: Any
+) -> tuple[Any, float]:
+    """Returns the part's solution and the time it took to solve."""
+    solver = getattr(solution_module, part_name, lambda x: "(solution pending)")
+    start = time.perf_counter()
+    solution = solver(digested_lines)
+    return solution, time.perf_counter() - start
+
+
+def run_part(
+    solution_module: ModuleType, part_name: str, input_lines: Iterable[str]
+) -> PartResult:
+    digested_lines, digest_time = digest(solution_module, input_lines)
+    solution, solve_time = solve(solution_module, part_name, digested_lines)
+    return PartResult(solution, digest_time, solve_time)
+
+
+def run_parts(
+    solution_module: ModuleType, input_lines: Iterable[str]
+) -> tuple[PartResult, ...]:
+    """
+    Solvers are free to consume their digested input, so each part normally gets
+    its own digest. A module whose parts never mutate the digest can set
+    `IMMUTABLE_DIGEST = True` to digest once and share the result between parts.
+    """
+    if not getattr(solution_module, "IMMUTABLE_DIGEST", False):
+        return tuple(
+            run_part(solution_module, part_name, input_lines)
+            for part_name in PART_NAMES
+        )
+    digested_lines, digest_time = digest(solution_module, input_lines)
+    parts: list[PartResult] = []
+    for part_name in PART_NAMES:
+        solution, solve_time = solve(solution_module, part_name, digested_lines)
+        if parts:
+            parts.append(PartResult(solution, 0.0, solve_time, shared_digest=True))
+        else:
+            parts.append(PartResult(solution, digest_time, solve_time))
+    return tuple(parts)
+
+
+def run_day(
+    day: int, implementation: str = "alpha", capture_errors: bool = True
+) -> DayResult:
+    """
+    Runs both parts of a day. Unless `capture_errors` is False, a failure is
+    recorded on the result instead of raised so one bad day can't sink a batch.
+    """
+    try:
+        solution_module = load_module(day, implementation)
+        parts = run_parts(solution_module, read_input(solution_module, day))
+    except Exception as error:
+        if not capture_errors:
+            raise
+        return DayResult(day, implementation, error=describe_error(error))
+    return DayResult(day, implementation, parts)
+
+
+def run_day_part(day: int, implementation: str, part_name: str) -> PartResult:
+    """Runs a single part of a day with its own digest."""
+    solution_module = load_module(day, implementation)
+    return run_part(solution_module, part_name, read_input(solution_module, day))
+
+
+def run_days(
+    days: list[int],
+    implementation: str = "alpha",
+    workers: Optional[int] = None,
+    parallel_parts: bool = False,
+) -> list[DayResult]:
+    """
+    Runs each day in its own worker process, or with `parallel_parts` each part of
+    each day in its own worker process. Results come back in the order of `days`
+    regardless of which worker finishes first.
+    """
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as executor:
+        if not parallel_parts:
+            return list(executor.map(run_day, days, [implementation] * len(days)))
+        part_futures = {
+            day: [
+                executor.submit(run_day_part, day, implementation, part_name)
+                for part_name in PART_NAMES
+            ]
+            for day in days
+        }
+        results: list[DayResult] = []
+        for day, futures in part_futures.items():
+            try:
+                parts = tuple(future.result() for future in futures)
+            except Exception as error:
+                results.append(
+                    DayResult(day, implementation, error=describe_error(error))
+                )
+            else:
+                results.append(DayResult(day, implementation, parts))
+        return results
+
+
+def describe_error(error: Exception) -> str:
+    return f"{type(error).__name__}: {error}"
+
+
+def format_solution(solution: Any) -> str:
+    solution_string = str(solution)
+    if "\n" in solution_string:
+        return "(multi-line)"
+    return solution_string
+
+
+def print_day_report(result: DayResult) -> None:
+    print("=" * HLINE_SIZE)
+    print(f"Running solutions to day {result.day}")
+    print("-" * HLINE_SIZE)
+    if result.error is not None:
+        print(f"Failed: {result.error}")
+        print("=" * HLINE_SIZE)
+        return
+    part_one, part_two = result.parts
+    for label, part in (("one", part_one), ("two", part_two)):
+        if part.status is PartStatus.OK:
+            print(f"Part {label} solution: {part.solution}")
+        else:
+            print(f"Part {label} solution: {part.status.name}")
+    print("-" * HLINE_SIZE)
+    for label, part in (("one", part_one), ("two", part_two)):
+        if part.shared_digest:
+            digest_note = "digest shared with part one"
+        else:
+            digest_note = f"{part.digest_time:.6f} digesting"
+        print(f"Part {label} runtime: {part.runtime:.6f} ({digest_note})")
+    print("=" * HLINE_SIZE)
+
+
+def format_table(results: list[DayResult]) -> str:
+    headers = ("Day", "Impl", "Part one", "Part two", "Time one", "Time two")
+    rows: list[tuple[str, ...]] = []
+    for result in results:
+        if result.error is not None:
+            error_name = result.error.split(":", 1)[0]
+            rows.append(
+                (str(result.day), result.implementation, error_name, "", "", "")
+            )
+            continue
+        part_one, part_two = result.parts
+        rows.append(
+            (
+                str(result.day),
+                result.implementation,
+                part_one.display_solution,
+                part_two.display_solution,
+                f"{part_one.runtime:.6f}",
+                f"{part_two.runtime:.6f}",
+            )
+        )
+    widths = [
+        max(len(row[column]) for row in rows + [headers])
+        for column in range(len(headers))
+    ]
+    lines = [
+        " | ".join(cell.ljust(width) for cell, width in zip(row, widths)).rstrip()
+        for row in [headers] + rows
+    ]
+    lines.insert(1, "-+-".join("-" * width for width in widths))
+    return "\n".join(lines)
+
+
+def print_batch_report(results: list[DayResult], wall_time: float) -> None:
+    print(format_table(results))
+    print("-" * HLINE_SIZE)
+    for result in results:
+        if result.error is not None:
+            print(f"Day {result.day} failed: {result.error}")
+    total = sum(result.runtime for result in results)
+    print(f"Total runtime: {total:.6f} (wall clock {wall_time:.6f})")
+
+
+@pytest.mark.parametrize(
+    "day_spec, days",
+    [("5", [5]), ("3-6", [3, 4, 5, 6]), ("1,4-5,2", [1, 2, 4, 5])],
+)
+def test_parse_days(day_spec, days):
+    assert parse_days(day_spec) == days
+
+
+def test_parse_days_all():
+    assert parse_days("all") == list(range(1, 24))
+
+
+def test_available_implementations():
+    assert available_implementations(9) == ["alpha", "beta", "gamma"]
+    assert available_implementations(19) == ["alpha"]
+
+
+def test_run_day_missing_implementation():
+    result = run_day(1, "nonexistent")
+    assert result.parts == ()
+    assert result.error is not None and "ModuleNotFoundError" in result.error
+
+
+def test_run_parts_shares_immutable_digest():
+    digest_calls: list[list[str]] = []
+    solution_module = ModuleType("shared")
+    solution_module.digest_input = lambda lines: digest_calls.append(lines) or lines
+    solution_module.part_one = len
+    solution_module.part_two = lambda lines: lines[0]
+    assert [p.solution for p in run_parts(solution_module, ["x", "y"])] == [2, "x"]
+    assert len(digest_calls) == 2
+    solution_module.IMMUTABLE_DIGEST = True
+    parts = run_parts(solution_module, ["x", "y"])
+    assert [p.solution for p in parts] == [2, "x"]
+    assert len(digest_calls) == 3
+    assert parts[1].shared_digest and parts[1].digest_time == 0
+
+
+def test_run_day_streams_input(tmp_path, monkeypatch):
+    monkeypatch.setenv(INPUTS_DIRECTORY_VARIABLE, str(tmp_path))
+    (tmp_path / "01.txt").write_text("199\n200\n208\n")
+    digested: list[Iterable[str]] = []
+    solution_module = ModuleType("streaming")
+    solution_module.digest_input = lambda lines: digested.append(lines) or list(lines)
+    solution_module.part_one = len
+    solution_module.part_two = lambda lines: lines[-1]
+    monkeypatch.setattr("solutions.runner.load_module", lambda *_: solution_module)
+    assert [p.solution for p in run_day(1, capture_errors=False).parts] == [3, "208"]
+    assert all(isinstance(lines, list) for lines in digested)
+    solution_module.STREAMING_DIGEST = True
+    assert [p.solution for p in run_day(1, capture_errors=False).parts] == [3, "208"]
+    assert all(isinstance(lines, InputStream) for lines in digested[2:])
+
+
+def test_run_days_parallel_parts():
+    results = run_days([1, 2], "nonexistent", workers=2, parallel_parts=True)
+    assert [result.day for result in results] == [1, 2]
+    assert all("ModuleNotFoundError" in result.error for result in results)
+
+
+def test_format_table_keeps_order():
+    results = [
+        DayResult(2, "alpha", (PartResult(1, 0, 0), PartResult("a\nb", 0, 0))),
+        DayResult(1, "alpha", error="FileNotFoundError: 01.txt"),
+    ]
+    lines = format_table(results).splitlines()
+    assert lines[2].startswith("2 ")
+    assert "(multi-line)" in lines[2]
+    assert lines[3].startswith("1 ")